@@ -3,6 +3,7 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QDir, QFile
 from PySide6.QtGui import QIcon
 from monitor.gui.main_window import MainWindow
+from monitor.gui.utils.icons import preload_icons
 from pathlib import Path
 
 
@@ -17,6 +18,7 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
 
     set_app_icon(app)
+    preload_icons()
 
     window = MainWindow()
     window.show()
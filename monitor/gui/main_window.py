@@ -1,12 +1,15 @@
-from pathlib import Path
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QLabel, QVBoxLayout
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from monitor.gui.widgets.navigation_bar import NavigationBar
 from monitor.gui.widgets.info_banner import InfoBanner
 from monitor.gui.pages.page_factory import PageFactory
 from monitor.gui.styles import style_manager
+from monitor.gui.utils.icons import get_icon
+from monitor.gui.utils.paths import get_icon_path
 from monitor.services.config_service import ConfigService
+from monitor.utils.logging_setup import get_logger
+
+_logger = get_logger("gui.main_window")
 
 # UI Layout Constants
 _WINDOW_WIDTH = 600
@@ -15,20 +18,22 @@ _WINDOW_X = 100
 _WINDOW_Y = 100
 _CONTENT_MARGIN_PX = 12
 _SIDEBAR_WIDTH = 200
+_WINDOW_ICON = "ecg-monitor.png"
 
 class MainWindow(QMainWindow):
     """Main application window with navigation sidebar and content area"""
     
     _instance = None  # Singleton instance
 
-    def __init__(self) -> None:
+    def __init__(self, config_service: ConfigService | None = None) -> None:
         super().__init__()
         MainWindow._instance = self  # Store reference for global access
         self._current_page = None
         self._content_area: QWidget
         self._nav_bar: NavigationBar
         self._info_banner: InfoBanner
-        self._config_service = ConfigService.get_instance()  # Use singleton instance
+        # Tests pass their own config; the app uses the singleton instance
+        self._config_service = config_service if config_service is not None else ConfigService.get_instance()
         self._setup_window()
         self._setup_ui()
         self._apply_styles()
@@ -52,9 +57,8 @@ class MainWindow(QMainWindow):
     
     def _setup_window_icon(self) -> None:
         """sets the main window's icon"""
-        icon_path = Path(__file__).parent / "icons" / "ecg-monitor.png"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        if icon_path := get_icon_path(_WINDOW_ICON):
+            self.setWindowIcon(get_icon(icon_path))
 
     def _setup_ui(self) -> None:
         """Initialize and layout all UI components"""
@@ -96,8 +100,9 @@ class MainWindow(QMainWindow):
     def _apply_styles(self) -> None:
         """Apply all stylesheets to the application"""
         try:
-            # Load and combine all required styles
-            combined_styles = style_manager.get_combined_styles(
+            # Load, combine and apply all required styles to the main window
+            style_manager.apply_to(
+                self,
                 "main_window",
                 "navigation_bar",
                 "info_banner",
@@ -106,11 +111,8 @@ class MainWindow(QMainWindow):
                 "settings"
             )
             
-            # Apply to the main window
-            self.setStyleSheet(combined_styles)
-            
         except FileNotFoundError as e:
-            print(f"Warning: Could not load styles: {e}")
+            _logger.warning("Could not load styles: %s", e)
             self._apply_fallback_styles()
 
     def _apply_fallback_styles(self) -> None:
@@ -157,6 +159,7 @@ class MainWindow(QMainWindow):
     # signal handlers
     # --------------------------------------------------------------------------
 
+    @Slot(str)
     def _on_page_changed(self, page_name: str) -> None:
         """Handle navigation page change"""
         self._update_content(page_name)
@@ -187,7 +190,7 @@ class MainWindow(QMainWindow):
             self._connect_page_signals(page_name, page)
             
         except ValueError as e:
-            print(f"Error creating page: {e}")
+            _logger.error("Error creating page: %s", e)
             # Fallback to error page
             error_widget = self._create_error_widget(page_name)
             self._content_layout.addWidget(error_widget)
@@ -207,12 +210,14 @@ class MainWindow(QMainWindow):
         placeholder.setText(f"Error: Page '{page_name}' not found")
         return placeholder
 
+    @Slot()
     def refresh_banner(self):
         """Refresh the info banner (called when settings change)"""
         if hasattr(self, '_info_banner'):
             self._info_banner.refresh()
     
+    @Slot()
     def refresh_banner_location(self):
-        """Refresh only the location in the banner (for better performance)"""
+        """Schedule a banner refresh after a location change (coalesced per event-loop pass)"""
         if hasattr(self, '_info_banner'):
-            self._info_banner.refresh_location()
+            self._info_banner.request_refresh()
@@ -4,7 +4,7 @@ import re
 from PySide6.QtWidgets import (QVBoxLayout, QLabel, QTableWidget, 
                                QTableWidgetItem, QPushButton, QInputDialog, 
                                QMessageBox, QWidget, QDialog, QHeaderView)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QIcon
 from monitor.gui.pages.base_page import BasePage
 from monitor.services.contact_db import ContactDatabase
@@ -156,6 +156,7 @@ class ContactsPage(BasePage):
             delete_btn.clicked.connect(lambda checked, pid=phone_id: self._delete_phone(pid))
             self._phone_table.setCellWidget(row, 1, delete_btn)
     
+    @Slot()
     def _add_email(self):
         """Add new email via dialog"""
         dialog = QInputDialog(self)
@@ -180,6 +181,7 @@ class ContactsPage(BasePage):
                 else:
                     QMessageBox.warning(self, "Error", "Email already exists")
     
+    @Slot()
     def _add_phone(self):
         """Add new phone via dialog"""
         dialog = PhoneInputDialog(self)
@@ -1,8 +1,8 @@
 """Devices settings tab"""
 
 
-from PySide6.QtWidgets import (QVBoxLayout, QWidget, QLineEdit, QFormLayout, QPushButton, QMessageBox)
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (QVBoxLayout, QWidget, QLineEdit, QGridLayout, QLabel, QPushButton, QMessageBox)
+from PySide6.QtCore import Qt, Slot
 
 
 class DevicesSettings(QWidget):
@@ -20,62 +20,58 @@ class DevicesSettings(QWidget):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
 
-        # Create form layout for better alignment
-        form_layout = QFormLayout()
-        form_layout.setSpacing(15)
+        # Label/field grid for alignment
+        grid_layout = QGridLayout()
+        grid_layout.setSpacing(15)
+        grid_layout.setColumnStretch(1, 1)
 
         # Relay Fail Count Threshold input
         self._relay_fail_threshold_input = QLineEdit()
         self._relay_fail_threshold_input.setObjectName("settings-input")
         self._relay_fail_threshold_input.setPlaceholderText("Enter threshold count...")
         self._relay_fail_threshold_input.returnPressed.connect(self._focus_next_field)
-        form_layout.addRow("Relay Fail Count Threshold:", self._relay_fail_threshold_input)
+        grid_layout.addWidget(QLabel("Relay Fail Count Threshold:"), 0, 0)
+        grid_layout.addWidget(self._relay_fail_threshold_input, 0, 1)
 
         # Camera Fail Count Threshold input
         self._camera_fail_threshold_input = QLineEdit()
         self._camera_fail_threshold_input.setObjectName("settings-input")
         self._camera_fail_threshold_input.setPlaceholderText("Enter threshold count...")
         self._camera_fail_threshold_input.returnPressed.connect(self._focus_next_field)
-        form_layout.addRow("Camera Fail Count Threshold:", self._camera_fail_threshold_input)
+        grid_layout.addWidget(QLabel("Camera Fail Count Threshold:"), 1, 0)
+        grid_layout.addWidget(self._camera_fail_threshold_input, 1, 1)
 
         # Minutes since last camera log input
         self._camera_log_minutes_input = QLineEdit()
         self._camera_log_minutes_input.setObjectName("settings-input")
         self._camera_log_minutes_input.setPlaceholderText("Enter minutes...")
         # No returnPressed for last field (nowhere to go)
-        form_layout.addRow("Minutes Since Last Camera Log:", self._camera_log_minutes_input)
+        grid_layout.addWidget(QLabel("Minutes Since Last Camera Log:"), 2, 0)
+        grid_layout.addWidget(self._camera_log_minutes_input, 2, 1)
 
         # Save button
         self._save_button = QPushButton("Save Settings")
         self._save_button.setObjectName("blue-button")
         self._save_button.clicked.connect(self._confirm_save)
-        form_layout.addRow("", self._save_button)
+        grid_layout.addWidget(self._save_button, 3, 1)
 
-        layout.addLayout(form_layout)
+        layout.addLayout(grid_layout)
 
         # Add stretch to push content to top
         layout.addStretch()
 
     def _load_from_config(self):
-        # Block signals to prevent saving during load
-        self._relay_fail_threshold_input.blockSignals(True)
-        self._camera_fail_threshold_input.blockSignals(True)
-        self._camera_log_minutes_input.blockSignals(True)
-        
-        # Load values
+        # Only returnPressed is connected, which setText() never emits - no blocking needed
         self._relay_fail_threshold_input.setText(self._config.get("devices", "relay_fail_threshold", ""))
         self._camera_fail_threshold_input.setText(self._config.get("devices", "camera_fail_threshold", ""))
         self._camera_log_minutes_input.setText(self._config.get("devices", "camera_log_minutes", ""))
-        
-        # Re-enable signals
-        self._relay_fail_threshold_input.blockSignals(False)
-        self._camera_fail_threshold_input.blockSignals(False)
-        self._camera_log_minutes_input.blockSignals(False)
 
     def _save_to_config(self):
-        self._config.set("devices", "relay_fail_threshold", self._relay_fail_threshold_input.text())
-        self._config.set("devices", "camera_fail_threshold", self._camera_fail_threshold_input.text())
-        self._config.set("devices", "camera_log_minutes", self._camera_log_minutes_input.text())
+        # One file write for all three values
+        with self._config.batch():
+            self._config.set("devices", "relay_fail_threshold", self._relay_fail_threshold_input.text())
+            self._config.set("devices", "camera_fail_threshold", self._camera_fail_threshold_input.text())
+            self._config.set("devices", "camera_log_minutes", self._camera_log_minutes_input.text())
     
     def get_relay_fail_threshold(self) -> str:
         """Get the relay fail count threshold value"""
@@ -101,6 +97,7 @@ class DevicesSettings(QWidget):
         """Set the minutes since last camera log value"""
         self._camera_log_minutes_input.setText(minutes)
     
+    @Slot()
     def _focus_next_field(self):
         """Focus the next input field when Enter is pressed"""
         current_widget = self.sender()
@@ -110,6 +107,7 @@ class DevicesSettings(QWidget):
         elif current_widget == self._camera_fail_threshold_input:
             self._camera_log_minutes_input.setFocus()
 
+    @Slot()
     def _confirm_save(self):
         """Show confirmation dialog before saving device settings."""
         reply = QMessageBox.question(
@@ -1,9 +1,13 @@
 """General settings tab"""
 
-from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QWidget, QLineEdit, 
-                               QPushButton, QFileDialog, QFormLayout)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QVBoxLayout, QWidget, QFileDialog, QGridLayout, QLabel
+from PySide6.QtCore import Qt, Signal, Slot
 from ...widgets.location_name_dialog import LocationNameDialog
+from ...utils.widget_factory import make_edit_row, set_display_text
+
+# Hints shown only while the corresponding config value is empty
+_LOCATION_NAME_PLACEHOLDER = "Enter location name..."
+_FILEPATH_PLACEHOLDER = "No file selected..."
 
 class GeneralSettings(QWidget):
     """General settings tab widget"""
@@ -23,79 +27,58 @@ class GeneralSettings(QWidget):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
         
-        # Create form layout for better alignment
-        form_layout = QFormLayout()
-        form_layout.setSpacing(15)
+        # Label/field grid for alignment
+        grid_layout = QGridLayout()
+        grid_layout.setSpacing(15)
+        grid_layout.setColumnStretch(1, 1)
         
         # Location Name Section
-        self._create_location_name_section(form_layout)
+        self._create_location_name_section(grid_layout, 0)
         
         # File Path Section  
-        self._create_filepath_section(form_layout)
+        self._create_filepath_section(grid_layout, 1)
         
-        layout.addLayout(form_layout)
+        layout.addLayout(grid_layout)
         
         # Add stretch to push content to top
         layout.addStretch()
     
-    def _create_location_name_section(self, form_layout: QFormLayout):
+    def _create_location_name_section(self, grid_layout: QGridLayout, row: int):
         """Create location name input section"""
-        # Create horizontal layout for location name display and edit button
-        location_name_layout = QHBoxLayout()
-        
-        # Location name display (read-only)
-        self._location_name_display = QLineEdit()
-        self._location_name_display.setObjectName("settings-display")
-        self._location_name_display.setReadOnly(True)
-        self._location_name_display.setPlaceholderText("Enter location name...")  # Placeholder text
-        
-        # Edit button
-        self._edit_location_name_btn = QPushButton("Edit")
-        self._edit_location_name_btn.setObjectName("settings-button")
-        self._edit_location_name_btn.clicked.connect(self._edit_location_name)
-        
-        # Add to layout
-        location_name_layout.addWidget(self._location_name_display)
-        location_name_layout.addWidget(self._edit_location_name_btn)
+        # Location name display (read-only) with edit button
+        location_name_layout, self._location_name_display, self._edit_location_name_btn = make_edit_row(
+            "Edit", self._edit_location_name
+        )
         
-        # Add to form
-        form_layout.addRow("Location Name:", location_name_layout)
+        # Add to grid
+        grid_layout.addWidget(QLabel("Location Name:"), row, 0)
+        grid_layout.addLayout(location_name_layout, row, 1)
     
-    def _create_filepath_section(self, form_layout: QFormLayout):
+    def _create_filepath_section(self, grid_layout: QGridLayout, row: int):
         """Create file path selection section"""
-        # Create horizontal layout for path display and choose button
-        filepath_layout = QHBoxLayout()
-        
-        # File path display (read-only)
-        self._filepath_display = QLineEdit()
-        self._filepath_display.setObjectName("settings-display")
-        self._filepath_display.setReadOnly(True)
-        self._filepath_display.setPlaceholderText("No file selected...")
-        
-        # Choose file button
-        self._choose_file_btn = QPushButton("Choose File")
-        self._choose_file_btn.setObjectName("settings-button")
-        self._choose_file_btn.clicked.connect(self._choose_file)
-        
-        # Add to layout
-        filepath_layout.addWidget(self._filepath_display)
-        filepath_layout.addWidget(self._choose_file_btn)
+        # File path display (read-only) with choose file button
+        filepath_layout, self._filepath_display, self._choose_file_btn = make_edit_row(
+            "Choose File", self._choose_file
+        )
         
-        # Add to form
-        form_layout.addRow("Monitor Program:", filepath_layout)
+        # Add to grid
+        grid_layout.addWidget(QLabel("Monitor Program:"), row, 0)
+        grid_layout.addLayout(filepath_layout, row, 1)
     
+    @Slot()
     def _edit_location_name(self):
         """Open dialog to edit location name"""
         current_location_name = self._location_name_display.text()
         accepted, new_location_name = LocationNameDialog.edit_location_name(current_location_name, self)
-        if accepted and new_location_name:
-            self._location_name_display.setText(new_location_name)
+        if accepted and new_location_name and new_location_name != current_location_name:
+            set_display_text(self._location_name_display, new_location_name, _LOCATION_NAME_PLACEHOLDER)
             self._config.set("general", "location_name", new_location_name)
             
             # Emit signal to notify other components of the location name change
             self.location_changed.emit(new_location_name)
 
     
+    @Slot()
     def _choose_file(self):
         """Open file dialog to choose monitored program"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -104,25 +87,18 @@ class GeneralSettings(QWidget):
             "",
             "Executable Files (*.exe);;All Files (*)"
         )
-        if file_path:
-            self._filepath_display.setText(file_path)
+        if file_path and file_path != self._filepath_display.text():
+            set_display_text(self._filepath_display, file_path, _FILEPATH_PLACEHOLDER)
             self._config.set("general", "monitor_program_path", file_path)
 
     def _load_from_config(self):
         """Load settings from config on startup"""
-        # Block signals to prevent saving during load
-        self._location_name_display.blockSignals(True)
-        self._filepath_display.blockSignals(True)
-        
-        # Load values
-        location = self._config.get("general", "location_name", "")
-        self._location_name_display.setText(location)
-        program_path = self._config.get("general", "monitor_program_path", "")
-        self._filepath_display.setText(program_path)
-        
-        # Re-enable signals
-        self._location_name_display.blockSignals(False)
-        self._filepath_display.blockSignals(False)
+        # Read-only displays have no save signals connected, so no blocking is needed
+        general = self._config.get_section("general")
+        set_display_text(self._location_name_display, general.get("location_name", ""),
+                         _LOCATION_NAME_PLACEHOLDER)
+        set_display_text(self._filepath_display, general.get("monitor_program_path", ""),
+                         _FILEPATH_PLACEHOLDER)
     
     def get_location_name(self) -> str:
         """Get the current location name"""
@@ -134,8 +110,8 @@ class GeneralSettings(QWidget):
     
     def set_location_name(self, name: str):
         """Set the location name"""
-        self._location_name_display.setText(name)
+        set_display_text(self._location_name_display, name, _LOCATION_NAME_PLACEHOLDER)
     
     def set_monitor_program_path(self, path: str):
         """Set the monitor program path"""
-        self._filepath_display.setText(path)
+        set_display_text(self._filepath_display, path, _FILEPATH_PLACEHOLDER)
@@ -1,8 +1,25 @@
 """System settings tab"""
 
-from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QWidget, QLineEdit, QPushButton, 
-                               QFormLayout, QCheckBox, QMessageBox, QLabel)
-from PySide6.QtCore import Qt
+from typing import Any, Dict, Tuple
+from PySide6.QtWidgets import (QVBoxLayout, QWidget, QPushButton, QGridLayout, QLabel, QCheckBox,
+                               QMessageBox, QInputDialog, QLineEdit, QDialogButtonBox)
+from PySide6.QtCore import Qt, QTimer, QCoreApplication, QSignalBlocker, QLocale, Slot
+from PySide6.QtGui import QDoubleValidator
+from monitor.gui.utils.widget_factory import make_edit_row, set_display_text
+from monitor.utils.logging_setup import get_logger
+
+_logger = get_logger("gui.settings.system")
+
+# Delay used to coalesce bursts of checkbox toggles into a single write
+_SAVE_DEBOUNCE_MS = 500
+
+# Accepted range and precision for the restart/snooze time (minutes)
+_RESTART_TIME_MIN = 0.0
+_RESTART_TIME_MAX = 1e6
+_RESTART_TIME_DECIMALS = 3
+
+# Hint shown only while no restart/snooze time is configured
+_RESTART_TIME_PLACEHOLDER = "Enter restart/snooze time..."
 
 class SystemSettings(QWidget):
     """System settings tab widget"""
@@ -10,8 +27,22 @@ class SystemSettings(QWidget):
     def __init__(self, config_service):
         super().__init__()
         self._config = config_service
+        self._pending: Dict[Tuple[str, str], Any] = {}
+        self._setup_save_timer()
         self._setup_ui()
         self._load_from_config()
+
+    def _setup_save_timer(self):
+        """Setup the timer that flushes pending config writes"""
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._flush_pending)
+
+        # Make sure nothing is lost when the application exits mid-debounce
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_pending)
     
     def _setup_ui(self):
         """Setup the system settings UI"""
@@ -19,101 +50,138 @@ class SystemSettings(QWidget):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
 
-        # Create form layout for better alignment
-        form_layout = QFormLayout()
-        form_layout.setSpacing(15)
+        # Label/field grid for alignment; unlabelled rows span both columns
+        grid_layout = QGridLayout()
+        grid_layout.setSpacing(15)
+        grid_layout.setColumnStretch(1, 1)
 
         # Enable Restart checkbox
         self._enable_restart_checkbox = QCheckBox("Enable Restart")
         self._enable_restart_checkbox.setObjectName("settings-checkbox")
         self._enable_restart_checkbox.toggled.connect(self._save_to_config)
-        form_layout.addRow("", self._enable_restart_checkbox)
+        grid_layout.addWidget(self._enable_restart_checkbox, 0, 0, 1, 2)
 
         # Open Ein Tzofia button
         self._open_ein_tzofia_btn = QPushButton("Open Ein Tzofia")
         self._open_ein_tzofia_btn.setObjectName("open-button")
         self._open_ein_tzofia_btn.clicked.connect(self._open_ein_tzofia)
-        form_layout.addRow("", self._open_ein_tzofia_btn)
+        grid_layout.addWidget(self._open_ein_tzofia_btn, 1, 0, 1, 2)
 
         # Close Ein Tzofia button
         self._close_ein_tzofia_btn = QPushButton("Close Ein Tzofia")
         self._close_ein_tzofia_btn.setObjectName("close-button")
         self._close_ein_tzofia_btn.clicked.connect(self._confirm_close_ein_tzofia)
-        form_layout.addRow("", self._close_ein_tzofia_btn)
+        grid_layout.addWidget(self._close_ein_tzofia_btn, 2, 0, 1, 2)
 
-        # Minutes to Restart input (combined with snooze time)
-        restart_time_layout = QHBoxLayout()
-        
-        # Time display (read-only)
-        self._restart_time_display = QLineEdit()
-        self._restart_time_display.setObjectName("settings-display")
-        self._restart_time_display.setReadOnly(True)
-        self._restart_time_display.setPlaceholderText("Enter restart/snooze time...")
-        
-        # Edit button
-        self._edit_restart_time_btn = QPushButton("Edit")
-        self._edit_restart_time_btn.setObjectName("settings-button")
-        self._edit_restart_time_btn.clicked.connect(self._edit_restart_time)
-        
-        # Add to layout
-        restart_time_layout.addWidget(self._restart_time_display)
-        restart_time_layout.addWidget(self._edit_restart_time_btn)
+        # Minutes to Restart input (combined with snooze time), read-only with edit button
+        restart_time_layout, self._restart_time_display, self._edit_restart_time_btn = make_edit_row(
+            "Edit", self._edit_restart_time
+        )
         
-        form_layout.addRow("Restart/Snooze Time (minutes):", restart_time_layout)
+        grid_layout.addWidget(QLabel("Restart/Snooze Time (minutes):"), 3, 0)
+        grid_layout.addLayout(restart_time_layout, 3, 1)
 
-        layout.addLayout(form_layout)
+        layout.addLayout(grid_layout)
 
         # Add stretch to push content to top
         layout.addStretch()
 
     def _load_from_config(self):
-        # Block signals to prevent saving during load
-        self._enable_restart_checkbox.blockSignals(True)
-        self._restart_time_display.blockSignals(True)
+        system = self._config.get_section("system")
+
+        # Block the checkbox's toggled signal to prevent saving during load
+        with QSignalBlocker(self._enable_restart_checkbox):
+            self._enable_restart_checkbox.setChecked(system.get("enable_restart", False))
         
         # Load values (use the same value for both restart and snooze)
-        self._enable_restart_checkbox.setChecked(self._config.get("system", "enable_restart", False))
-        restart_time = self._config.get("system", "minutes_to_restart", "")
-        self._restart_time_display.setText(str(restart_time))
-        
-        # Re-enable signals
-        self._enable_restart_checkbox.blockSignals(False)
-        self._restart_time_display.blockSignals(False)
+        restart_time = system.get("minutes_to_restart", "")
+        set_display_text(self._restart_time_display, str(restart_time), _RESTART_TIME_PLACEHOLDER)
 
+    @Slot()
     def _save_to_config(self):
-        self._config.set("system", "enable_restart", self._enable_restart_checkbox.isChecked())
+        """Queue changed values and (re)start the debounced flush"""
+        self._queue_write("system", "enable_restart", self._enable_restart_checkbox.isChecked())
         # Save the same value for both restart and snooze time
         restart_time = self._restart_time_display.text()
-        self._config.set("system", "minutes_to_restart", restart_time)
-        self._config.set("system", "startup_snooze_time", restart_time)
+        self._queue_write("system", "minutes_to_restart", restart_time)
+        self._queue_write("system", "startup_snooze_time", restart_time)
+        
+        if self._pending:
+            self._save_timer.start()
+
+    def _queue_write(self, section: str, key: str, value: Any):
+        """Buffer a config write, dropping values that match what is already stored"""
+        if self._config.get(section, key) == value:
+            self._pending.pop((section, key), None)
+        else:
+            self._pending[(section, key)] = value
+
+    @Slot()
+    def _flush_pending(self):
+        """Write all buffered values to the config in one pass"""
+        self._save_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        with self._config.batch():
+            for (section, key), value in pending.items():
+                self._config.set(section, key, value)
+
+    def hideEvent(self, event):
+        """Flush pending writes when the tab is hidden or the page is replaced"""
+        self._flush_pending()
+        super().hideEvent(event)
     
+    def _create_restart_time_dialog(self, current_time: str) -> QInputDialog:
+        """Build the restart/snooze time dialog with a numeric validator on its line edit"""
+        dialog = QInputDialog(self)
+        dialog.setWindowTitle("Edit Restart/Snooze Time")
+        dialog.setInputMode(QInputDialog.InputMode.TextInput)
+        dialog.setLabelText("Enter time in minutes:")
+        dialog.setTextValue(current_time)
+
+        validator = QDoubleValidator(
+            _RESTART_TIME_MIN, _RESTART_TIME_MAX, _RESTART_TIME_DECIMALS, dialog
+        )
+        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        # Always accept '.' as the decimal separator regardless of system locale
+        validator.setLocale(QLocale.c())
+
+        line_edit = dialog.findChild(QLineEdit)
+        line_edit.setValidator(validator)
+
+        # QInputDialog builds its button box lazily - setting the OK text forces the layout now
+        dialog.setOkButtonText(dialog.tr("OK"))
+        # Only allow OK while the text is a complete, in-range number
+        ok_button = dialog.findChild(QDialogButtonBox).button(QDialogButtonBox.StandardButton.Ok)
+        ok_button.setEnabled(line_edit.hasAcceptableInput())
+        line_edit.textChanged.connect(lambda: ok_button.setEnabled(line_edit.hasAcceptableInput()))
+        return dialog
+
+    @Slot()
     def _edit_restart_time(self):
         """Open dialog to edit restart/snooze time"""
-        from PySide6.QtWidgets import QInputDialog
-        current_time = self._restart_time_display.text()
-        
-        time_value, ok = QInputDialog.getText(
-            self,
-            "Edit Restart/Snooze Time", 
-            "Enter time in minutes:",
-            text=current_time
-        )
+        dialog = self._create_restart_time_dialog(self._restart_time_display.text())
+        try:
+            if not dialog.exec():
+                return
+            time_value = dialog.textValue()
+        finally:
+            dialog.deleteLater()
         
-        if ok and time_value:
-            # Validate that it's a number
-            try:
-                float(time_value)  # Check if it's a valid number
-                self._restart_time_display.setText(time_value)
-                self._save_to_config()
-            except ValueError:
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
+        if time_value:
+            set_display_text(self._restart_time_display, time_value, _RESTART_TIME_PLACEHOLDER)
+            # Explicit edits are persisted right away
+            self._save_to_config()
+            self._flush_pending()
     
+    @Slot()
     def _open_ein_tzofia(self):
         """Open Ein Tzofia - placeholder implementation"""
-        print("Opening Ein Tzofia...")
+        _logger.debug("Opening Ein Tzofia...")
         # TODO: Implement open logic
     
+    @Slot()
     def _confirm_close_ein_tzofia(self):
         """Show confirmation dialog for closing Ein Tzofia"""
         reply = QMessageBox.question(
@@ -126,7 +194,7 @@ class SystemSettings(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             # TODO: Implement close logic
-            print("Closing Ein Tzofia...")
+            _logger.debug("Closing Ein Tzofia...")
             # You can add the actual close implementation here
     
     def get_enable_restart(self) -> bool:
@@ -143,7 +211,7 @@ class SystemSettings(QWidget):
     
     def set_restart_time(self, time: str):
         """Set the restart/snooze time value"""
-        self._restart_time_display.setText(time)
+        set_display_text(self._restart_time_display, time, _RESTART_TIME_PLACEHOLDER)
     
     # Legacy methods for backward compatibility
     def get_minutes_to_restart(self) -> str:
@@ -1,7 +1,10 @@
 """Style management utilities for the Monitor Prototype application"""
 
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List, Tuple
+
+# Dynamic property recording which stylesheet apply_to() last set on a widget
+_STYLE_KEY_PROPERTY = "_style_key"
 
 class StyleManager:
     """Manages application styles and provides utilities for loading QSS files"""
@@ -9,6 +12,10 @@ class StyleManager:
     def __init__(self) -> None:
         self._styles_dir = Path(__file__).parent
         self._loaded_styles: Dict[str, str] = {}
+        self._combined_cache: Dict[Tuple[str, ...], str] = {}
+        self._available_styles: List[str] | None = None
+        # Bumped whenever cached content may change so apply_to() re-applies
+        self._generation = 0
     
     def load_style(self, style_name: str) -> str:
         """Load a QSS style file and return its contents"""
@@ -20,8 +27,8 @@ class StyleManager:
         if not style_path.exists():
             raise FileNotFoundError(f"Style file not found: {style_path}")
         
-        with open(style_path, 'r', encoding='utf-8') as file:
-            style_content = file.read()
+        # Read raw bytes in one call - skips the text-mode newline translation layer
+        style_content = style_path.read_bytes().decode('utf-8')
         
         # Cache the loaded style
         self._loaded_styles[style_name] = style_content
@@ -29,30 +36,45 @@ class StyleManager:
     
     def get_combined_styles(self, *style_names: str) -> str:
         """Combine multiple style files into a single stylesheet"""
-        combined_styles = []
+        if style_names in self._combined_cache:
+            return self._combined_cache[style_names]
+        
+        combined_styles = "\n".join(self.load_style(style_name) for style_name in style_names)
         
-        for style_name in style_names:
-            style_content = self.load_style(style_name)
-            combined_styles.append(f"/* {style_name.upper()} STYLES */")
-            combined_styles.append(style_content)
-            combined_styles.append("")  # Empty line for separation
+        # Cache the combined stylesheet for this exact set of styles
+        self._combined_cache[style_names] = combined_styles
+        return combined_styles
+    
+    def apply_to(self, widget: Any, *style_names: str) -> None:
+        """Apply combined styles to a widget, skipping the QSS reparse if they are already applied"""
+        # Stored as a string - tuples do not round-trip through QVariant unchanged
+        style_key = f"{self._generation}:{'|'.join(style_names)}"
+        if widget.property(_STYLE_KEY_PROPERTY) == style_key:
+            return
         
-        return "\n".join(combined_styles)
+        widget.setStyleSheet(self.get_combined_styles(*style_names))
+        widget.setProperty(_STYLE_KEY_PROPERTY, style_key)
     
     def reload_style(self, style_name: str) -> str:
         """Force reload a style file (useful for development)"""
         if style_name in self._loaded_styles:
             del self._loaded_styles[style_name]
+        self._combined_cache.clear()
+        self._generation += 1
         return self.load_style(style_name)
     
     def get_available_styles(self) -> list[str]:
         """Get a list of all available style files"""
-        qss_files = list(self._styles_dir.glob("*.qss"))
-        return [file.stem for file in qss_files]
+        if self._available_styles is None:
+            self._available_styles = [file.stem for file in self._styles_dir.glob("*.qss")]
+        return list(self._available_styles)
     
     def clear_cache(self) -> None:
         """Clear the style cache (useful for development)"""
         self._loaded_styles.clear()
+        self._combined_cache.clear()
+        self._available_styles = None
+        self._generation += 1
 
 # Global style manager instance
 style_manager = StyleManager()
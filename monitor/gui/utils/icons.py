@@ -0,0 +1,28 @@
+"""Shared QIcon cache for the Monitor Prototype application"""
+
+from typing import Dict
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication
+from monitor.gui.utils.paths import get_icons_dir
+
+# QIcon is implicitly shared, so one instance per path can back any number of widgets
+_ICON_CACHE: Dict[str, QIcon] = {}
+
+# File types under the icons directory that preload_icons() loads
+_ICON_SUFFIXES = (".svg", ".png")
+
+def get_icon(icon_path: str) -> QIcon:
+    """Get the cached icon for a file path, loading it on first use"""
+    icon = _ICON_CACHE.get(icon_path)
+    if icon is None:
+        icon = _ICON_CACHE[icon_path] = QIcon(icon_path)
+    return icon
+
+def preload_icons() -> None:
+    """Load every bundled icon into the cache ahead of building the UI"""
+    # QIcon needs a running QApplication; without one, icons load lazily via get_icon
+    if QApplication.instance() is None:
+        return
+    for icon_file in get_icons_dir().iterdir():
+        if icon_file.suffix in _ICON_SUFFIXES:
+            get_icon(str(icon_file))
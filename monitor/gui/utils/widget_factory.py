@@ -0,0 +1,42 @@
+"""Widget construction helpers shared by the settings pages"""
+
+from typing import Callable
+from PySide6.QtWidgets import QHBoxLayout, QLineEdit, QPushButton
+
+def make_edit_row(button_label: str, slot: Callable[[], None],
+                  display_obj_name: str = "settings-display",
+                  btn_obj_name: str = "settings-button") -> tuple[QHBoxLayout, QLineEdit, QPushButton]:
+    """Create a read-only display with an action button next to it
+    
+    The display has no placeholder; use set_display_text() to fill it.
+    
+    Args:
+        button_label: Text of the action button
+        slot: Callable connected to the button's clicked signal
+        display_obj_name: Object name of the display (for CSS targeting)
+        btn_obj_name: Object name of the button (for CSS targeting)
+        
+    Returns:
+        tuple: (row layout, display line edit, action button)
+    """
+    # Display (read-only)
+    display = QLineEdit()
+    display.setObjectName(display_obj_name)
+    display.setReadOnly(True)
+    
+    # Action button
+    button = QPushButton(button_label)
+    button.setObjectName(btn_obj_name)
+    button.clicked.connect(slot)
+    
+    # Add to layout
+    row_layout = QHBoxLayout()
+    row_layout.addWidget(display)
+    row_layout.addWidget(button)
+    return row_layout, display, button
+
+
+def set_display_text(display: QLineEdit, text: str, placeholder: str) -> None:
+    """Set a display's text, keeping a placeholder only while the text is empty"""
+    display.setText(text)
+    display.setPlaceholderText("" if text else placeholder)
@@ -2,11 +2,14 @@
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QPushButton
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QIcon
+from monitor.gui.utils.icons import get_icon
 from monitor.gui.utils.paths import get_icon_path
 from monitor.services.alert_models import Alert, AlertType
+from monitor.utils.logging_setup import get_logger
 from typing import List
 
+_logger = get_logger("gui.alerts_list")
+
 class AlertsList(QWidget):
     """Widget displaying list of alerts using QTableWidget"""
     
@@ -62,7 +65,7 @@ class AlertsList(QWidget):
         icon_item = QTableWidgetItem()
         icon_path = self._get_alert_icon(alert.alert_type)
         if icon_path:
-            icon_item.setIcon(QIcon(icon_path))
+            icon_item.setIcon(get_icon(icon_path))
         icon_item.setFlags(icon_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
         icon_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
         self._table.setItem(row, 0, icon_item)
@@ -103,7 +106,7 @@ class AlertsList(QWidget):
         if self._alert_db:
             success = self._alert_db.resolve_alert(alert_id)
             if not success:
-                print(f"Failed to resolve alert {alert_id} in database")
+                _logger.warning("Failed to resolve alert %s in database", alert_id)
         
         # Remove from UI
         for row in range(self._table.rowCount()):
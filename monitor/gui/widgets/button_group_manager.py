@@ -1,8 +1,8 @@
-from PySide6.QtWidgets import QPushButton, QButtonGroup
-from PySide6.QtCore import Qt, QObject, Signal
-from PySide6.QtGui import QIcon, QPalette
-from functools import partial
+from PySide6.QtWidgets import QAbstractButton, QPushButton, QButtonGroup
+from PySide6.QtCore import Qt, QObject, Signal, Slot
+from PySide6.QtGui import QPalette
 from typing import Dict
+from monitor.gui.utils.icons import get_icon
 
 class ButtonGroupManager(QObject):
     """Manages a group of exclusive buttons with selection state and signals"""
@@ -15,6 +15,7 @@ class ButtonGroupManager(QObject):
         self._btn_map: Dict[str, QPushButton] = {}
         self._btn_group = QButtonGroup(self)
         self._btn_group.setExclusive(True)
+        self._btn_group.buttonClicked.connect(self._on_button_clicked)
     
     # --------------------------------------------------------------------------
     # public interface
@@ -28,11 +29,9 @@ class ButtonGroupManager(QObject):
         btn.setCheckable(True)
         
         if icon_path:
-            btn.setIcon(QIcon(icon_path))
+            btn.setIcon(get_icon(icon_path))
             btn.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
         
-        btn.clicked.connect(partial(self.selection_changed.emit, name))
-        
         self._btn_group.addButton(btn)
         self._btn_map[name] = btn
         return btn
@@ -57,3 +56,12 @@ class ButtonGroupManager(QObject):
     def button_count(self) -> int:
         """Returns the number of registered buttons"""
         return len(self._btn_map)
+
+    # --------------------------------------------------------------------------
+    # signal handlers
+    # --------------------------------------------------------------------------
+
+    @Slot(QAbstractButton)
+    def _on_button_clicked(self, btn: QAbstractButton) -> None:
+        """Forwards a group click as the clicked button's object name"""
+        self.selection_changed.emit(btn.objectName())
@@ -1,8 +1,10 @@
 """Info banner widget for displaying location and version information"""
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Slot
 
+# Window in which repeated refresh requests are coalesced into one update
+_REFRESH_THROTTLE_MS = 50
 
 class InfoBanner(QWidget):
     """
@@ -13,10 +15,22 @@ class InfoBanner(QWidget):
     def __init__(self, config_service):
         super().__init__()
         self._config_service = config_service
+        # Last displayed values, used to skip setText() when nothing changed
+        self._last_location: str | None = None
+        self._last_monitor_version: str | None = None
+        self._last_ein_tzofia_version: str | None = None
         self.setObjectName("info-banner")
+        self._setup_refresh_timer()
         self._setup_ui()
         self._load_banner_data()
 
+    def _setup_refresh_timer(self):
+        """Set up the trailing-edge timer behind request_refresh()."""
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(_REFRESH_THROTTLE_MS)
+        self._refresh_timer.timeout.connect(self._load_banner_data)
+
     def _setup_ui(self):
         """Set up the banner layout and widgets."""
         # Create horizontal layout with minimal spacing
@@ -52,28 +66,47 @@ class InfoBanner(QWidget):
         self.refresh_location()
         self.refresh_versions()
 
+    @Slot()
     def refresh_location(self):
         """Refresh only the location name from config."""
         location_name = self._config_service.get("general", "location_name", "Unknown Location")
         self._set_location_label(location_name)
 
+    @Slot()
     def refresh_versions(self):
         """Refresh only the version information from config."""
-        monitor_version = self._config_service.get(section="versions", key="monitor_version", default="Unknown")
-        ein_tzofia_version = self._config_service.get(section="versions", key="ein_tzofia_version", default="Unknown")
-        
-        self._set_monitor_version_label(monitor_version)
-        self._set_eintzofia_version_label(ein_tzofia_version)
+        versions = self._config_service.get_section("versions")
+        self._set_monitor_version_label(versions.get("monitor_version", "Unknown"))
+        self._set_eintzofia_version_label(versions.get("ein_tzofia_version", "Unknown"))
 
+    @Slot()
     def refresh(self):
         """Refresh all banner data from config."""
         self._load_banner_data()
+
+    @Slot()
+    def request_refresh(self):
+        """
+        Schedule a refresh at the end of a short throttle window.
+        Repeated requests before it fires collapse into a single refresh.
+        """
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
     
     def _set_location_label(self, location_name):
+        if location_name == self._last_location:
+            return
+        self._last_location = location_name
         self._location_label.setText(f"Location: {location_name}")
     
     def _set_monitor_version_label(self, monitor_version):
+        if monitor_version == self._last_monitor_version:
+            return
+        self._last_monitor_version = monitor_version
         self._monitor_version_label.setText(f"Monitor v{monitor_version}")
 
     def _set_eintzofia_version_label(self, ein_tzofia_version):
-        self._ein_tzofia_version_label.setText(f"Ein Tzofia v{ein_tzofia_version}")
\ No newline at end of file
+        if ein_tzofia_version == self._last_ein_tzofia_version:
+            return
+        self._last_ein_tzofia_version = ein_tzofia_version
+        self._ein_tzofia_version_label.setText(f"Ein Tzofia v{ein_tzofia_version}")
@@ -29,7 +29,6 @@ class LocationNameDialog(QDialog):
         # Input field
         self._location_name_input = QLineEdit()
         self._location_name_input.setText(self._current_location_name)
-        self._location_name_input.selectAll()  # Select all text for easy editing
         self._location_name_input.setPlaceholderText("Enter location name...")
         layout.addWidget(self._location_name_input)
         
@@ -51,8 +50,11 @@ class LocationNameDialog(QDialog):
         
         # Connect Enter key to save
         self._location_name_input.returnPressed.connect(self.accept)
-        
-        # Focus on input field
+    
+    def showEvent(self, event):
+        """Select and focus the input only once the dialog is actually shown"""
+        super().showEvent(event)
+        self._location_name_input.selectAll()  # Select all text for easy editing
         self._location_name_input.setFocus()
     
     def get_location_name(self) -> str:
@@ -63,12 +65,13 @@ class LocationNameDialog(QDialog):
     def edit_location_name(current_location_name: str = "", parent=None) -> tuple[bool, str]:
         """
         Static method to show dialog and get result
-        Returns (accepted, location_name)
+        Returns (accepted, location_name); an unchanged name is reported as not accepted
         """
         dialog = LocationNameDialog(current_location_name, parent)
         result = dialog.exec()
         
         if result == QDialog.DialogCode.Accepted:
-            return True, dialog.get_location_name()
-        else:
-            return False, current_location_name
+            location_name = dialog.get_location_name()
+            if location_name != current_location_name.strip():
+                return True, location_name
+        return False, current_location_name
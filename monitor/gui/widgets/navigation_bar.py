@@ -1,5 +1,6 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from PySide6.QtCore import Signal, Qt
+from typing import Final
 from monitor.gui.widgets.button_group_manager import ButtonGroupManager
 from monitor.gui.utils.paths import get_icon_path
 
@@ -13,12 +14,20 @@ class NavigationBar(QWidget):
 
     page_changed = Signal(str)
 
+    # (label, page name, icon file) for each navigation button, in display order
+    _PAGES: Final[tuple[tuple[str, str, str], ...]] = (
+        ("Alerts", "alerts", "warning.svg"),
+        ("Contacts", "contacts", "contacts.svg"),
+        ("Settings", "settings", "settings.svg"),
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self._button_manager = ButtonGroupManager()
         
         # Forward the signal from button manager to maintain API compatibility
-        self._button_manager.selection_changed.connect(self.page_changed.emit)
+        # (signal-to-signal, so Qt relays it without a Python call)
+        self._button_manager.selection_changed.connect(self.page_changed)
         
         self._setup_ui()
 
@@ -38,11 +47,7 @@ class NavigationBar(QWidget):
         layout.setSpacing(_BUTTON_SPACING_PX)
 
         # ---- buttons ----------------------------------------------------------------
-        for label, page, icon in [
-            ("Alerts", "alerts", "warning.svg"),
-            ("Contacts", "contacts", "contacts.svg"),
-            ("Settings", "settings", "settings.svg"),
-        ]:
+        for label, page, icon in self._PAGES:
             btn = self._button_manager.add_button(label, page, get_icon_path(icon))
             layout.addWidget(btn)
 
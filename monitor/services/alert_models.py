@@ -1,68 +1,88 @@
 """Alert data models for the Monitor Prototype"""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import List
+import itertools
 import random
+import string
 
-class AlertType(Enum):
+class AlertType(str, Enum):
     SPRINKLER = "sprinkler"
     FAN = "fan"
     CAMERA = "camera"
     SOFTWARE = "software"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Alert:
     id: str
     alert_type: AlertType
     description: str
     timestamp: datetime
 
+# Dummy alert layout
+_SPRINKLER_COUNT = 3
+_FAN_COUNT = 2
+_CAMERA_COUNT = 3
+_FAN_NUMBERS = "1, 2, 3, 4"  # Always show all 4 fan numbers for dummy data
+_IP_PREFIX = "192.168.1."
+_FIRST_CAMERA_HOST = 202
+_TIMESTAMP_TICK = timedelta(microseconds=1)
+
 def generate_dummy_alerts() -> List[Alert]:
     """Generate dummy alerts for testing"""
-    alerts = []
+    # One clock read per batch; consecutive alerts are offset by 1 microsecond so
+    # they keep their generation order when sorted by timestamp
+    now = datetime.now()
+    tick = _TIMESTAMP_TICK
+    offsets = itertools.count()
+    sprinkler, fan, camera, software = (
+        AlertType.SPRINKLER, AlertType.FAN, AlertType.CAMERA, AlertType.SOFTWARE
+    )
     
     # Sprinkler alerts (A-Z + group number - single sprinkler number)
-    for i in range(3):
-        letter = chr(65 + random.randint(0, 25))  # A-Z
-        group = random.randint(1, 5)
-        sprinkler_number = random.randint(1, 4)  # Single number
-        alerts.append(Alert(
+    letters = random.choices(string.ascii_uppercase, k=_SPRINKLER_COUNT)
+    groups = [random.randint(1, 5) for _ in range(_SPRINKLER_COUNT)]
+    sprinkler_numbers = [random.randint(1, 4) for _ in range(_SPRINKLER_COUNT)]  # Single number
+    alerts = [
+        Alert(
             id=f"sprinkler_{i}",
-            alert_type=AlertType.SPRINKLER,
-            description=f"{letter}{group} - {sprinkler_number}",
-            timestamp=datetime.now()
-        ))
+            alert_type=sprinkler,
+            description=f"{letters[i]}{groups[i]} - {sprinkler_numbers[i]}",
+            timestamp=now + next(offsets) * tick
+        )
+        for i in range(_SPRINKLER_COUNT)
+    ]
     
     # Fan alerts (AY + group number - always 4 fan numbers)
-    for i in range(2):
-        group = random.randint(1, 5)
-        # Always show all 4 fan numbers for dummy data
-        fan_numbers = "1, 2, 3, 4"
-        alerts.append(Alert(
+    alerts += [
+        Alert(
             id=f"fan_{i}",
-            alert_type=AlertType.FAN,
-            description=f"AY{group} - {fan_numbers}",
-            timestamp=datetime.now()
-        ))
+            alert_type=fan,
+            description=f"AY{random.randint(1, 5)} - {_FAN_NUMBERS}",
+            timestamp=now + next(offsets) * tick
+        )
+        for i in range(_FAN_COUNT)
+    ]
     
     # Camera alerts (IP addresses starting from 192.168.1.202)
-    for i in range(3):
-        ip = f"192.168.1.{202 + i}"
-        alerts.append(Alert(
+    alerts += [
+        Alert(
             id=f"camera_{i}",
-            alert_type=AlertType.CAMERA,
-            description=ip,
-            timestamp=datetime.now()
-        ))
+            alert_type=camera,
+            description=f"{_IP_PREFIX}{_FIRST_CAMERA_HOST + i}",
+            timestamp=now + next(offsets) * tick
+        )
+        for i in range(_CAMERA_COUNT)
+    ]
     
     # Software alerts
     alerts.append(Alert(
         id="software_1",
-        alert_type=AlertType.SOFTWARE,
+        alert_type=software,
         description="error",
-        timestamp=datetime.now()
+        timestamp=now + next(offsets) * tick
     ))
     
     return alerts
@@ -1,26 +1,88 @@
 
+import copy
 import json
-from pathlib import Path
-from typing import Any, Dict
+import os
 import threading
+from contextlib import contextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Final, Iterator, Mapping
+from weakref import WeakValueDictionary
+
+from monitor.utils.rw_lock import RWLock
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the stdlib json module is used otherwise
+    orjson = None
+
+# Upper bound on how long a writer waits for readers to drain
+_WRITE_LOCK_TIMEOUT = 5
+
+# Shared read-only stand-in for a missing section, so lookups allocate nothing
+_EMPTY: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Used when no config file exists yet; always deep-copied, never handed out directly
+_DEFAULT_CONFIG: Final[Dict[str, Dict[str, Any]]] = {
+    "general": {"location_name": "", "monitor_program_path": ""},
+    "system": {"enable_restart": False, "minutes_to_restart": "", "startup_snooze_time": ""},
+    "devices": {"relay_fail_threshold": "", "camera_fail_threshold": "", "camera_log_minutes": ""}
+}
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 
 class ConfigService:
     """Thread-safe service for loading and saving application settings to a JSON config file."""
 
-    _instance = None
-    _lock = threading.RLock()  # Re-entrant lock for thread safety
+    _instance = None  # Default instance returned by get_instance()
+    # One live instance per resolved config path; entries vanish once nothing references them
+    _instances: "WeakValueDictionary[Path, ConfigService]" = WeakValueDictionary()
+    _instances_lock = threading.Lock()
 
     def __new__(cls, config_path: str = "config.json"):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+        key = Path(config_path).resolve()
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instances[key] = instance
+            if cls._instance is None:
+                cls._instance = instance
+        return instance
 
     def __init__(self, config_path: str = "config.json"):
         if self._initialized:
             return
+        self._lock = RWLock()  # Shared reads, exclusive (re-entrant) writes
         self._config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        # Read-only copy of _config for lock-free readers, replaced wholesale on every change
+        self._snapshot: Mapping[str, Mapping[str, Any]] = _EMPTY
+        # Nesting depth of batch() blocks and whether a set() inside them still needs saving
+        self._batch_depth = 0
+        self._dirty = False
+        # Serializes file writes, which happen outside the config lock
+        self._io_lock = threading.Lock()
+        # Bytes currently on disk, so saves that would write the same content are skipped
+        self._last_serialized: bytes | None = None
+        # Sequence numbers of the latest serialization and of the one on disk, so a slow
+        # writer never replaces a newer file with an older payload
+        self._save_seq = 0
+        self._written_seq = 0
         self._load()
         self._initialized = True
 
@@ -31,61 +93,102 @@ class ConfigService:
             cls._instance = cls()
         return cls._instance
 
-    def _acquire_lock(self, timeout=5):
-        acquired = self._lock.acquire(timeout=timeout)
-        if not acquired:
-            raise TimeoutError("Could not acquire config lock within timeout.")
-        return True
-
-    def _release_lock(self):
-        self._lock.release()
-
     def _load(self):
-        if self._acquire_lock():
-            try:
-                if self._config_path.exists():
-                    with open(self._config_path, "r", encoding="utf-8") as f:
-                        self._config = json.load(f)
-                else:
-                    self._config = self._default_config()
-            finally:
-                self._release_lock()
+        with self._lock.write_lock(_WRITE_LOCK_TIMEOUT):
+            if self._config_path.exists():
+                raw = self._config_path.read_bytes()
+                self._config = _loads(raw)
+                self._last_serialized = raw
+            else:
+                self._config = self._default_config()
+            # Only sections are published; top-level scalars stay in _config (see all_mutable)
+            self._snapshot = MappingProxyType({
+                section: MappingProxyType(dict(values))
+                for section, values in self._config.items()
+                if isinstance(values, dict)
+            })
 
     def _default_config(self) -> Dict[str, Any]:
-        return {
-            "general": {"location_name": "", "monitor_program_path": ""},
-            "system": {"enable_restart": False, "minutes_to_restart": "", "startup_snooze_time": ""},
-            "devices": {"relay_fail_threshold": "", "camera_fail_threshold": "", "camera_log_minutes": ""}
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
     def save(self):
-        if self._acquire_lock():
-            try:
-                with open(self._config_path, "w", encoding="utf-8") as f:
-                    json.dump(self._config, f, indent=2)
-            finally:
-                self._release_lock()
+        # Only serialization needs the config lock; the disk write happens after it is released
+        with self._lock.write_lock(_WRITE_LOCK_TIMEOUT):
+            payload, seq = self._serialize_locked()
+        self._write(payload, seq)
+
+    def _serialize_locked(self) -> tuple[bytes, int]:
+        """Serialize the config; the caller must hold the write lock."""
+        self._dirty = False
+        self._save_seq += 1
+        return _dumps(self._config), self._save_seq
+
+    def _write(self, payload: bytes, seq: int):
+        """Write a serialized config to disk, skipping stale or unchanged payloads."""
+        with self._io_lock:
+            if seq < self._written_seq:
+                return
+            # Record the sequence even when the content is unchanged, so older payloads stay stale
+            self._written_seq = seq
+            if payload == self._last_serialized:
+                return
+            # Write a sibling temp file and swap it in, so the config is never left half-written
+            tmp_path = self._config_path.with_name(self._config_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._config_path)
+            self._last_serialized = payload
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
-        if self._acquire_lock():
-            try:
-                return self._config.get(section, {}).get(key, default)
-            finally:
-                self._release_lock()
+        # Lock-free: the snapshot is immutable and swapped in with a single attribute write
+        return self._snapshot.get(section, _EMPTY).get(key, default)
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        """Return a copy of a whole section, read from the snapshot without locking."""
+        return dict(self._snapshot.get(section, _EMPTY))
 
     def set(self, section: str, key: str, value: Any):
-        if self._acquire_lock():
-            try:
-                if section not in self._config:
-                    self._config[section] = {}
-                self._config[section][key] = value
-                self.save()
-            finally:
-                self._release_lock()
-
-    def all(self) -> Dict[str, Any]:
-        if self._acquire_lock():
-            try:
-                return self._config.copy()
-            finally:
-                self._release_lock()
+        pending = None
+        with self._lock.write_lock(_WRITE_LOCK_TIMEOUT):
+            if section not in self._config:
+                self._config[section] = {}
+            self._config[section][key] = value
+            # Republish only the changed section; the others are shared with the old snapshot
+            snapshot = dict(self._snapshot)
+            snapshot[section] = MappingProxyType(dict(self._config[section]))
+            self._snapshot = MappingProxyType(snapshot)
+            self._dirty = True
+            # Serialize in this critical section rather than re-taking the lock in save()
+            if self._batch_depth == 0:
+                pending = self._serialize_locked()
+        if pending is not None:
+            self._write(*pending)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several set() calls into a single save when the outermost block exits."""
+        pending = None
+        try:
+            with self._lock.write_lock(_WRITE_LOCK_TIMEOUT):
+                self._batch_depth += 1
+                try:
+                    yield
+                finally:
+                    self._batch_depth -= 1
+                    if self._batch_depth == 0 and self._dirty:
+                        pending = self._serialize_locked()
+        finally:
+            # Write after the lock is released, even if the block raised
+            if pending is not None:
+                self._write(*pending)
+
+    def all(self) -> Mapping[str, Mapping[str, Any]]:
+        """Return the read-only snapshot of the whole config (no copy is made)."""
+        return self._snapshot
+
+    def all_mutable(self) -> Dict[str, Any]:
+        """Return a deep copy of the whole config that the caller may modify."""
+        with self._lock.read_lock():
+            return copy.deepcopy(self._config)
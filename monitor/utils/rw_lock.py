@@ -0,0 +1,104 @@
+"""Reader-writer lock for read-heavy shared state"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class RWLock:
+    """
+    Writer-preferring reader-writer lock.
+
+    Any number of readers may hold the lock together; a writer holds it exclusively.
+    New readers wait while a writer is waiting, so saves are not starved by reads.
+    The write side is re-entrant, and the writing thread may also take the read side.
+    The read side is not re-entrant: a reader must not re-acquire it (or upgrade to
+    a write) while holding it.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: int | None = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+
+    def acquire_read(self, timeout: float | None = None) -> bool:
+        """Acquire the shared side; returns False if the timeout expires"""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                # The writing thread already has exclusive access
+                self._writer_depth += 1
+                return True
+            if not self._cond.wait_for(
+                lambda: self._writer is None and not self._writers_waiting, timeout
+            ):
+                return False
+            self._readers += 1
+            return True
+
+    def release_read(self) -> None:
+        """Release the shared side"""
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._release_write()
+                return
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self, timeout: float | None = None) -> bool:
+        """Acquire the exclusive side; returns False if the timeout expires"""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return True
+            self._writers_waiting += 1
+            try:
+                acquired = self._cond.wait_for(
+                    lambda: self._writer is None and self._readers == 0, timeout
+                )
+            finally:
+                self._writers_waiting -= 1
+            if not acquired:
+                # Readers held back by this writer may proceed again
+                self._cond.notify_all()
+                return False
+            self._writer = me
+            self._writer_depth = 1
+            return True
+
+    def release_write(self) -> None:
+        """Release the exclusive side"""
+        with self._cond:
+            self._release_write()
+
+    def _release_write(self) -> None:
+        if self._writer != threading.get_ident():
+            raise RuntimeError("Cannot release a write lock held by another thread.")
+        self._writer_depth -= 1
+        if self._writer_depth == 0:
+            self._writer = None
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_lock(self, timeout: float | None = None) -> Iterator[None]:
+        """Hold the shared side for the duration of a with-block"""
+        if not self.acquire_read(timeout):
+            raise TimeoutError("Could not acquire read lock within timeout.")
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self, timeout: float | None = None) -> Iterator[None]:
+        """Hold the exclusive side for the duration of a with-block"""
+        if not self.acquire_write(timeout):
+            raise TimeoutError("Could not acquire write lock within timeout.")
+        try:
+            yield
+        finally:
+            self.release_write()
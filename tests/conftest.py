@@ -1,21 +1,93 @@
 """Shared test fixtures and configuration"""
 
+import functools
+import os
 import pytest
-import sys
-from PySide6.QtWidgets import QApplication
+
+# Nothing is shown or screenshotted - skip the windowing backend unless the caller chose one
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@functools.lru_cache(maxsize=1)
+def _qapp():
+    """The one QApplication for the test process, created on first use"""
+    # Imported here so non-GUI test runs never load Qt
+    from PySide6.QtWidgets import QApplication
+    from monitor.gui.utils.icons import preload_icons
+
+    app = QApplication.instance() or QApplication([])
+    # Load the bundled icons once so every window and nav bar reuses the cached QIcons
+    preload_icons()
+    return app
+
+
+# Modal entry points that would block an unattended run until it times out
+_MODAL_CALLS = {
+    "QDialog": ("exec",),
+    "QMessageBox": ("exec", "question", "information", "warning", "critical"),
+    "QInputDialog": ("exec", "getText", "getInt", "getDouble", "getItem"),
+    "QFileDialog": ("exec", "getOpenFileName", "getSaveFileName", "getExistingDirectory"),
+}
+
+
+def _refuse_modal(*args, **kwargs):
+    """Stand-in for the modal calls above - fail fast instead of hanging"""
+    raise RuntimeError("A real modal dialog was opened during a test - patch it where it is used")
 
 
 @pytest.fixture(scope="session")
 def qapp():
-    """Create QApplication for the entire test session"""
-    if not QApplication.instance():
-        app = QApplication(sys.argv)
-    else:
-        app = QApplication.instance()
-    
-    yield app
-    
-    # Don't quit the app during testing as it may cause issues
+    """Create QApplication for the entire test session, with real modal dialogs disabled"""
+    from PySide6 import QtWidgets
+
+    # Tests that expect a dialog patch the name in the module under test, which takes precedence
+    with pytest.MonkeyPatch.context() as mp:
+        for class_name, attrs in _MODAL_CALLS.items():
+            for attr in attrs:
+                mp.setattr(getattr(QtWidgets, class_name), attr, _refuse_modal)
+        # Never quit the app during testing - other test modules share it
+        yield _qapp()
+
+
+@pytest.fixture(scope="session")
+def base_config_dict():
+    """Config contents shared by file-backed tests - built once per session, treat as read-only"""
+    return {
+        "general": {
+            "location_name": "Test Location",
+            "monitor_program_path": "/test/path"
+        },
+        "versions": {
+            "monitor_version": "1.0.0",
+            "ein_tzofia_version": "1.0.0"
+        },
+        "system": {
+            "enable_restart": True,
+            "minutes_to_restart": "5",
+            "startup_snooze_time": "5"
+        },
+        "devices": {
+            "relay_fail_threshold": "100",
+            "camera_fail_threshold": "200",
+            "camera_log_minutes": "3"
+        }
+    }
+
+
+@pytest.fixture
+def set_config_values():
+    """Return a helper that backs a mocked ConfigService's get/get_section with one dict"""
+    def _set(config, values):
+        """values maps (section, key) to the stored value"""
+        # Group by section once here rather than on every get_section() call
+        sections = {}
+        for (section, key), value in values.items():
+            sections.setdefault(section, {})[key] = value
+
+        config.get.side_effect = lambda section, key, default=None: values.get((section, key), default)
+        # Hand out a copy, as ConfigService.get_section does
+        config.get_section.side_effect = lambda section: dict(sections.get(section, ()))
+    return _set
 
 
 def pytest_configure():
@@ -0,0 +1,21 @@
+"""Lightweight test doubles shared by the widget tests"""
+
+
+class FakeConfig:
+    """Minimal ConfigService stand-in that records get_section() and set() calls"""
+
+    def __init__(self, values):
+        # values maps (section, key) to the stored value
+        self._values = values
+        self.section_calls = []
+        self.set_calls = []
+
+    def get(self, section, key, default=None):
+        return self._values.get((section, key), default)
+
+    def get_section(self, section):
+        self.section_calls.append(section)
+        return {key: value for (sec, key), value in self._values.items() if sec == section}
+
+    def set(self, section, key, value):
+        self.set_calls.append((section, key, value))
@@ -11,17 +11,21 @@ from monitor.services.alert_models import Alert, AlertType, generate_dummy_alert
 class TestAlertDatabase(unittest.TestCase):
     """Test cases for AlertDatabase"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by all tests in the class"""
+        cls._temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary directory and every test database in it"""
+        cls._temp_dir.cleanup()
+
     def setUp(self):
-        """Set up test database with temporary file"""
-        self.test_db_fd, self.test_db_path = tempfile.mkstemp(suffix='.db')
-        os.close(self.test_db_fd)  # Close file descriptor, we only need the path
+        """Set up a fresh test database named after the running test"""
+        self.test_db_path = os.path.join(self._temp_dir.name, f"{self._testMethodName}.db")
         self.alert_db = AlertDatabase(db_file=self.test_db_path)
 
-    def tearDown(self):
-        """Clean up test database"""
-        if os.path.exists(self.test_db_path):
-            os.unlink(self.test_db_path)
-
     def test_database_initialization(self):
         """Test that database is properly initialized"""
         # Database should be created and accessible
@@ -181,6 +185,17 @@ class TestAlertModels(unittest.TestCase):
         self.assertEqual(AlertType.FAN.value, "fan")
         self.assertEqual(AlertType.CAMERA.value, "camera")
         self.assertEqual(AlertType.SOFTWARE.value, "software")
+        self.assertEqual(AlertType.SPRINKLER, "sprinkler")
+
+    def test_alert_is_frozen_and_hashable(self):
+        """Test that alerts are immutable and can be deduplicated in a set"""
+        timestamp = datetime.now()
+        alert = Alert("test_alert", AlertType.FAN, "AY1 - 1", timestamp)
+        duplicate = Alert("test_alert", AlertType.FAN, "AY1 - 1", timestamp)
+        
+        with self.assertRaises(AttributeError):
+            alert.description = "changed"
+        self.assertEqual(len({alert, duplicate}), 1)
 
     def test_generate_dummy_alerts(self):
         """Test dummy alert generation"""
@@ -199,6 +214,11 @@ class TestAlertModels(unittest.TestCase):
             self.assertTrue(alert.id)
             self.assertTrue(alert.description)
             self.assertIsInstance(alert.timestamp, datetime)
+        
+        # Timestamps are distinct and follow generation order
+        timestamps = [alert.timestamp for alert in dummy_alerts]
+        self.assertEqual(len(set(timestamps)), len(timestamps))
+        self.assertEqual(timestamps, sorted(timestamps))
 
 
 if __name__ == '__main__':
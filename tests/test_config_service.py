@@ -1,9 +1,10 @@
 """Tests for ConfigService"""
 
 import pytest
-import tempfile
 import os
 import json
+import threading
+from collections.abc import Mapping
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
@@ -11,37 +12,11 @@ from monitor.services.config_service import ConfigService
 
 
 @pytest.fixture
-def temp_config_file():
-    """Create a temporary config file for testing"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        test_config = {
-            "general": {
-                "location_name": "Test Location",
-                "monitor_program_path": "/test/path"
-            },
-            "versions": {
-                "monitor_version": "1.0.0",
-                "ein_tzofia_version": "1.0.0"
-            },
-            "system": {
-                "enable_restart": True,
-                "minutes_to_restart": "5",
-                "startup_snooze_time": "5"
-            },
-            "devices": {
-                "relay_fail_threshold": "100",
-                "camera_fail_threshold": "200",
-                "camera_log_minutes": "3"
-            }
-        }
-        json.dump(test_config, f)
-        temp_path = f.name
-    
-    yield temp_path
-    
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+def temp_config_file(tmp_path, base_config_dict):
+    """Write the shared base config to a per-test file and return its path"""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(base_config_dict), encoding="utf-8")
+    return str(config_path)
 
 
 @pytest.fixture
@@ -64,6 +39,15 @@ class TestConfigService:
         
         assert service1 is service2
 
+    def test_instances_shared_per_path(self, config_service, temp_config_file, tmp_path):
+        """Test that the same path shares one instance while other paths get their own"""
+        assert ConfigService(temp_config_file) is config_service
+        
+        other = ConfigService(str(tmp_path / "other.json"))
+        assert other is not config_service
+        assert other.get("general", "location_name") == ""
+        assert config_service.get("general", "location_name") == "Test Location"
+
     def test_get_existing_values(self, config_service):
         """Test getting existing configuration values"""
         assert config_service.get("general", "location_name") == "Test Location"
@@ -75,6 +59,29 @@ class TestConfigService:
         assert config_service.get("general", "nonexistent", "default") == "default"
         assert config_service.get("nonexistent_section", "key", "default") == "default"
 
+    def test_get_section(self, config_service):
+        """Test reading a whole section at once"""
+        general = config_service.get_section("general")
+        assert general == {"location_name": "Test Location", "monitor_program_path": "/test/path"}
+        
+        # Returned dict is a copy - mutating it must not touch the config
+        general["location_name"] = "Changed"
+        assert config_service.get("general", "location_name") == "Test Location"
+        
+        assert config_service.get_section("nonexistent_section") == {}
+
+    def test_reads_do_not_block_on_writer(self, config_service):
+        """Test that readers in other threads proceed while the write lock is held"""
+        results = []
+        with config_service._lock.write_lock():
+            thread = threading.Thread(
+                target=lambda: results.append(config_service.get("general", "location_name"))
+            )
+            thread.start()
+            thread.join(timeout=1)
+        
+        assert results == ["Test Location"]
+
     def test_set_and_get_values(self, config_service):
         """Test setting and getting configuration values"""
         config_service.set("general", "location_name", "New Location")
@@ -84,6 +91,26 @@ class TestConfigService:
         config_service.set("new_section", "new_key", "new_value")
         assert config_service.get("new_section", "new_key") == "new_value"
 
+    def test_batch_saves_once(self, config_service):
+        """Test that set() calls inside batch() are written with a single save"""
+        with patch.object(config_service, '_write', wraps=config_service._write) as mock_write:
+            with config_service.batch():
+                config_service.set("devices", "relay_fail_threshold", "1")
+                with config_service.batch():
+                    config_service.set("devices", "camera_fail_threshold", "2")
+                
+                # Nothing is written until the outermost batch exits
+                mock_write.assert_not_called()
+                assert config_service.get("devices", "camera_fail_threshold") == "2"
+            
+            mock_write.assert_called_once()
+        
+        # An empty batch does not write at all
+        with patch.object(config_service, '_write') as mock_write:
+            with config_service.batch():
+                pass
+            mock_write.assert_not_called()
+
     def test_save_and_load_persistence(self, temp_config_file):
         """Test that changes persist after saving"""
         ConfigService._instance = None
@@ -92,49 +119,156 @@ class TestConfigService:
         service1 = ConfigService(temp_config_file)
         service1.set("general", "location_name", "Persistent Location")
         
-        # Create new service instance and verify persistence
+        # Drop the first instance so the next one re-reads the file, then verify persistence
         ConfigService._instance = None
+        del service1
         service2 = ConfigService(temp_config_file)
         assert service2.get("general", "location_name") == "Persistent Location"
 
-    def test_default_config_creation(self):
+    def test_save_replaces_file_atomically(self, config_service, temp_config_file):
+        """Test that save writes via a temp file that is renamed over the config"""
+        with patch('monitor.services.config_service.os.replace', wraps=os.replace) as mock_replace:
+            config_service.set("general", "location_name", "Atomic Location")
+        
+        mock_replace.assert_called_once()
+        assert Path(mock_replace.call_args[0][1]) == Path(temp_config_file)
+        assert not Path(temp_config_file + ".tmp").exists()
+        with open(temp_config_file, encoding="utf-8") as f:
+            assert json.load(f)["general"]["location_name"] == "Atomic Location"
+
+    def test_set_takes_config_lock_once(self, config_service):
+        """Test that set() serializes inside its own critical section instead of via save()"""
+        with patch.object(config_service._lock, 'acquire_write', wraps=config_service._lock.acquire_write) as mock_acquire:
+            config_service.set("general", "location_name", "Single Lock")
+        
+        mock_acquire.assert_called_once()
+
+    def test_file_written_outside_config_lock(self, config_service):
+        """Test that the disk write happens after the config lock is released"""
+        lock_held = []
+        real_write = config_service._write
+        
+        def record_write(payload, seq):
+            lock_held.append(config_service._lock._writer is not None)
+            real_write(payload, seq)
+        
+        with patch.object(config_service, '_write', side_effect=record_write):
+            config_service.set("general", "location_name", "Unlocked Write")
+            with config_service.batch():
+                config_service.set("devices", "relay_fail_threshold", "7")
+        
+        assert lock_held == [False, False]
+
+    def test_stale_payload_not_written(self, config_service, temp_config_file):
+        """Test that an older serialization never overwrites a newer one on disk"""
+        with config_service._lock.write_lock():
+            config_service._config["general"]["location_name"] = "Older"
+            old_payload, old_seq = config_service._serialize_locked()
+            config_service._config["general"]["location_name"] = "Newer"
+            new_payload, new_seq = config_service._serialize_locked()
+        
+        config_service._write(new_payload, new_seq)
+        config_service._write(old_payload, old_seq)
+        
+        with open(temp_config_file, encoding="utf-8") as f:
+            assert json.load(f)["general"]["location_name"] == "Newer"
+
+    def test_stale_payload_not_written_after_unchanged_save(self, config_service, temp_config_file):
+        """Test that a skipped unchanged write still marks older payloads as stale"""
+        # Put the service's own serialization on disk first
+        config_service.save()
+        with config_service._lock.write_lock():
+            config_service._config["general"]["location_name"] = "Changed"
+            changed_payload, changed_seq = config_service._serialize_locked()
+            config_service._config["general"]["location_name"] = "Test Location"
+            same_payload, same_seq = config_service._serialize_locked()
+        
+        # Identical to the file, so nothing is written - but the later sequence wins
+        config_service._write(same_payload, same_seq)
+        config_service._write(changed_payload, changed_seq)
+        
+        with open(temp_config_file, encoding="utf-8") as f:
+            assert json.load(f)["general"]["location_name"] == "Test Location"
+
+    def test_save_skipped_when_content_unchanged(self, config_service):
+        """Test that writing an identical config does not touch the file"""
+        with patch('monitor.services.config_service.os.replace', wraps=os.replace) as mock_replace:
+            config_service.set("general", "location_name", "Same Location")
+            config_service.set("general", "location_name", "Same Location")
+            config_service.save()
+        
+        mock_replace.assert_called_once()
+
+    def test_default_config_creation(self, tmp_path):
         """Test that default config is created when file doesn't exist"""
         ConfigService._instance = None
         
-        with tempfile.NamedTemporaryFile(delete=True) as f:
-            non_existent_path = f.name + "_nonexistent"
+        non_existent_path = tmp_path / "nonexistent.json"
         
-        service = ConfigService(non_existent_path)
+        service = ConfigService(str(non_existent_path))
         
         # Check default values are present
         assert service.get("general", "location_name") == ""
         assert service.get("system", "enable_restart") is False
         assert service.get("devices", "relay_fail_threshold") == ""
         
-        # Cleanup
-        if os.path.exists(non_existent_path):
-            os.unlink(non_existent_path)
+        # Changing the defaults of one service must not leak into later ones
+        service.set("general", "location_name", "Changed")
+        assert service._default_config()["general"]["location_name"] == ""
+
+    def test_non_section_values_ignored(self, tmp_path, base_config_dict):
+        """Test that top-level non-section values load and are kept out of the snapshot"""
+        ConfigService._instance = None
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({**base_config_dict, "version": "1.0"}), encoding="utf-8")
+        
+        service = ConfigService(str(config_path))
+        
+        assert service.get("general", "location_name") == "Test Location"
+        assert "version" not in service.all()
+        assert service.get("version", "anything", "default") == "default"
+        assert service.all_mutable()["version"] == "1.0"
 
     def test_all_method(self, config_service):
         """Test getting all configuration data"""
         all_config = config_service.all()
         
-        assert isinstance(all_config, dict)
+        assert isinstance(all_config, Mapping)
         assert "general" in all_config
         assert "system" in all_config
         assert "devices" in all_config
         assert all_config["general"]["location_name"] == "Test Location"
+        
+        # The snapshot is read-only
+        with pytest.raises(TypeError):
+            all_config["general"]["location_name"] = "Changed"
+
+    def test_all_mutable_method(self, config_service):
+        """Test getting an independent, mutable copy of the configuration"""
+        all_config = config_service.all_mutable()
+        
+        assert isinstance(all_config, dict)
+        all_config["general"]["location_name"] = "Changed"
+        assert config_service.get("general", "location_name") == "Test Location"
 
     def test_thread_safety_timeout(self, config_service):
         """Test that lock timeout works correctly"""
         # This is a basic test - full thread safety testing would require more complex setup
-        config_service._lock.acquire()
-        try:
-            # This should work since we're in the same thread (re-entrant lock)
+        with config_service._lock.write_lock():
+            # This should work since we're in the same thread (writer may read and re-enter)
             result = config_service.get("general", "location_name")
             assert result == "Test Location"
-        finally:
-            config_service._lock.release()
+            config_service.set("general", "location_name", "Writer Location")
+        
+        # A writer from another thread times out while the write lock is held
+        errors = []
+        with config_service._lock.write_lock():
+            thread = threading.Thread(
+                target=lambda: errors.append(config_service._lock.acquire_write(timeout=0.05))
+            )
+            thread.start()
+            thread.join()
+        assert errors == [False]
 
     def test_multiple_get_instance_calls(self, temp_config_file):
         """Test multiple calls to get_instance return same object"""
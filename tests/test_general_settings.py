@@ -1,78 +1,80 @@
 """Tests for GeneralSettings widget"""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from PySide6.QtWidgets import QApplication, QWidget
-from PySide6.QtCore import QTimer
-import sys
+from unittest.mock import patch
 
 from monitor.gui.pages.settings_sub_pages.general_settings import GeneralSettings
-from monitor.services.config_service import ConfigService
+from tests.fakes import FakeConfig
+
+# Config values used by the general_settings fixture, built once at import
+_DEFAULT_CFG = {
+    ("general", "location_name"): "Test Location",
+    ("general", "monitor_program_path"): "/test/program.exe"
+}
 
 
 @pytest.fixture
-def app():
-    """Create QApplication for testing"""
-    if not QApplication.instance():
-        app = QApplication(sys.argv)
-    else:
-        app = QApplication.instance()
-    yield app
-    # Don't quit the app as it might be used by other tests
+def fake_config():
+    """FakeConfig holding the default test values"""
+    return FakeConfig(_DEFAULT_CFG)
 
 
 @pytest.fixture
-def mock_config():
-    """Mock ConfigService for testing"""
-    config = Mock(spec=ConfigService)
-    config.get = Mock()
-    config.set = Mock()
-    return config
+def general_settings(qtbot, fake_config):
+    """Create GeneralSettings widget for testing - qtbot closes and deletes it afterwards"""
+    widget = GeneralSettings(fake_config)
+    qtbot.addWidget(widget)
+    return widget
 
 
-@pytest.fixture
-def general_settings(app, mock_config):
-    """Create GeneralSettings widget for testing"""
-    # Set up default mock returns
-    mock_config.get.side_effect = lambda section, key, default="": {
-        ("general", "location_name"): "Test Location",
-        ("general", "monitor_program_path"): "/test/program.exe"
-    }.get((section, key), default)
-    
-    widget = GeneralSettings(mock_config)
+@pytest.fixture(scope="module")
+def prebuilt_general_settings(qapp):
+    """One GeneralSettings built from the default config, shared by read-only tests"""
+    widget = GeneralSettings(FakeConfig(_DEFAULT_CFG))
     yield widget
     widget.deleteLater()
 
 
+@pytest.fixture
+def mock_dialog():
+    """Patch LocationNameDialog where GeneralSettings looks it up"""
+    with patch('monitor.gui.pages.settings_sub_pages.general_settings.LocationNameDialog') as dialog:
+        yield dialog
+
+
+@pytest.fixture
+def mock_file_dialog():
+    """Patch QFileDialog where GeneralSettings looks it up"""
+    with patch('monitor.gui.pages.settings_sub_pages.general_settings.QFileDialog') as dialog:
+        yield dialog
+
+
 class TestGeneralSettings:
     """Test cases for GeneralSettings widget"""
 
-    def test_initialization(self, general_settings, mock_config):
+    def test_initialization(self, general_settings, fake_config):
         """Test widget initializes correctly"""
-        assert general_settings._config is mock_config
-        assert hasattr(general_settings, '_location_name_display')
-        assert hasattr(general_settings, '_filepath_display')
-        assert hasattr(general_settings, '_edit_location_name_btn')
-        assert hasattr(general_settings, '_choose_file_btn')
-
-    def test_load_from_config_called_on_init(self, app, mock_config):
+        assert general_settings._config is fake_config
+
+    @pytest.mark.parametrize("attr", [
+        "_location_name_display",
+        "_filepath_display",
+        "_edit_location_name_btn",
+        "_choose_file_btn",
+        "location_changed",
+    ])
+    def test_has_attribute(self, prebuilt_general_settings, attr):
+        """Test that the widgets and the location_changed signal are defined"""
+        assert hasattr(prebuilt_general_settings, attr)
+
+    def test_load_from_config_called_on_init(self, general_settings, fake_config):
         """Test that config is loaded during initialization"""
-        mock_config.get.side_effect = lambda section, key, default="": {
-            ("general", "location_name"): "Initial Location",
-            ("general", "monitor_program_path"): "/initial/path.exe"
-        }.get((section, key), default)
-        
-        widget = GeneralSettings(mock_config)
-        
-        # Verify config was queried
-        mock_config.get.assert_any_call("general", "location_name", "")
-        mock_config.get.assert_any_call("general", "monitor_program_path", "")
+        # Verify config was queried as one section
+        assert fake_config.section_calls == ["general"]
         
         # Verify UI was updated
-        assert widget.get_location_name() == "Initial Location"
-        assert widget.get_monitor_program_path() == "/initial/path.exe"
-        
-        widget.deleteLater()
+        assert general_settings.get_location_name() == "Test Location"
+        assert general_settings.get_monitor_program_path() == "/test/program.exe"
 
     def test_location_name_getters_setters(self, general_settings):
         """Test location name getter and setter methods"""
@@ -88,51 +90,64 @@ class TestGeneralSettings:
         assert general_settings.get_monitor_program_path() == "/new/path/program.exe"
         assert general_settings._filepath_display.text() == "/new/path/program.exe"
 
-    def test_ui_elements_created(self, general_settings):
+    def test_ui_elements_created(self, prebuilt_general_settings):
         """Test that all UI elements are created properly"""
         # Test location name section
-        assert general_settings._location_name_display is not None
-        assert general_settings._location_name_display.isReadOnly()
-        assert general_settings._location_name_display.objectName() == "settings-display"
+        assert prebuilt_general_settings._location_name_display is not None
+        assert prebuilt_general_settings._location_name_display.isReadOnly()
+        assert prebuilt_general_settings._location_name_display.objectName() == "settings-display"
         
-        assert general_settings._edit_location_name_btn is not None
-        assert general_settings._edit_location_name_btn.text() == "Edit"
-        assert general_settings._edit_location_name_btn.objectName() == "settings-button"
+        assert prebuilt_general_settings._edit_location_name_btn is not None
+        assert prebuilt_general_settings._edit_location_name_btn.text() == "Edit"
+        assert prebuilt_general_settings._edit_location_name_btn.objectName() == "settings-button"
         
         # Test filepath section
-        assert general_settings._filepath_display is not None
-        assert general_settings._filepath_display.isReadOnly()
-        assert general_settings._filepath_display.objectName() == "settings-display"
+        assert prebuilt_general_settings._filepath_display is not None
+        assert prebuilt_general_settings._filepath_display.isReadOnly()
+        assert prebuilt_general_settings._filepath_display.objectName() == "settings-display"
         
-        assert general_settings._choose_file_btn is not None
-        assert general_settings._choose_file_btn.text() == "Choose File"
-        assert general_settings._choose_file_btn.objectName() == "settings-button"
+        assert prebuilt_general_settings._choose_file_btn is not None
+        assert prebuilt_general_settings._choose_file_btn.text() == "Choose File"
+        assert prebuilt_general_settings._choose_file_btn.objectName() == "settings-button"
 
-    def test_signal_defined(self, general_settings):
-        """Test that location_changed signal is defined"""
-        assert hasattr(general_settings, 'location_changed')
+    def test_placeholder_only_when_empty(self, qtbot):
+        """Test that a placeholder is shown only for empty config values"""
+        config = FakeConfig({
+            ("general", "location_name"): "Loaded Location",
+            ("general", "monitor_program_path"): ""
+        })
+        
+        widget = GeneralSettings(config)
+        qtbot.addWidget(widget)
+        
+        assert widget._location_name_display.placeholderText() == ""
+        assert widget._filepath_display.placeholderText() == "No file selected..."
+        
+        # Placeholder is dropped once a real value lands
+        widget.set_monitor_program_path("/some/path.exe")
+        assert widget._filepath_display.placeholderText() == ""
 
-    @patch('monitor_prototype.gui.pages.settings_sub_pages.general_settings.LocationNameDialog')
-    def test_edit_location_name_signal_emission(self, mock_dialog, general_settings, qtbot):
+    def test_edit_location_name_signal_emission(self, mock_dialog, general_settings):
         """Test that location_changed signal is emitted when location is edited"""
         # Mock the dialog to return accepted=True and new name
         mock_dialog.edit_location_name.return_value = (True, "Updated Location")
         
-        # Set up signal spy
-        with qtbot.waitSignal(general_settings.location_changed, timeout=1000) as blocker:
-            # Simulate button click
-            general_settings._edit_location_name()
+        # The signal is emitted synchronously, so a plain list collects it
+        emitted = []
+        general_settings.location_changed.connect(emitted.append)
         
-        # Verify signal was emitted with correct value
-        assert blocker.args == ["Updated Location"]
+        # Simulate button click
+        general_settings._edit_location_name()
+        
+        # Verify signal was emitted once with correct value
+        assert emitted == ["Updated Location"]
         
         # Verify config was updated
-        general_settings._config.set.assert_called_with("general", "location_name", "Updated Location")
+        assert general_settings._config.set_calls[-1] == ("general", "location_name", "Updated Location")
         
         # Verify UI was updated
         assert general_settings.get_location_name() == "Updated Location"
 
-    @patch('monitor_prototype.gui.pages.settings_sub_pages.general_settings.LocationNameDialog')
     def test_edit_location_name_dialog_cancelled(self, mock_dialog, general_settings):
         """Test that nothing happens when location name dialog is cancelled"""
         # Mock the dialog to return cancelled
@@ -144,13 +159,14 @@ class TestGeneralSettings:
         
         # Verify nothing changed
         assert general_settings.get_location_name() == original_name
-        general_settings._config.set.assert_not_called()
+        assert general_settings._config.set_calls == []
 
-    @patch('monitor_prototype.gui.pages.settings_sub_pages.general_settings.QFileDialog')
-    def test_choose_file_dialog(self, mock_file_dialog, general_settings):
-        """Test file chooser dialog functionality"""
-        # Mock file dialog to return a file path
-        mock_file_dialog.getOpenFileName.return_value = ("/new/program.exe", "")
+    @pytest.mark.parametrize("selected_path", ["/new/program.exe", ""], ids=["selected", "cancelled"])
+    def test_choose_file_dialog(self, mock_file_dialog, general_settings, selected_path):
+        """Test file chooser dialog - a chosen file is saved, a cancelled dialog changes nothing"""
+        # An empty path is what the dialog returns when cancelled
+        mock_file_dialog.getOpenFileName.return_value = (selected_path, "")
+        original_path = general_settings.get_monitor_program_path()
         
         # Call the method
         general_settings._choose_file()
@@ -161,49 +177,26 @@ class TestGeneralSettings:
         assert call_args[0][1] == "Select Program to Monitor"
         assert "Executable Files (*.exe)" in call_args[0][3]
         
-        # Verify config was updated
-        general_settings._config.set.assert_called_with("general", "monitor_program_path", "/new/program.exe")
-        
-        # Verify UI was updated
-        assert general_settings.get_monitor_program_path() == "/new/program.exe"
-
-    @patch('monitor_prototype.gui.pages.settings_sub_pages.general_settings.QFileDialog')
-    def test_choose_file_dialog_cancelled(self, mock_file_dialog, general_settings):
-        """Test that nothing happens when file dialog is cancelled"""
-        # Mock file dialog to return empty path (cancelled)
-        mock_file_dialog.getOpenFileName.return_value = ("", "")
-        original_path = general_settings.get_monitor_program_path()
-        
-        # Call the method
-        general_settings._choose_file()
-        
-        # Verify nothing changed
-        assert general_settings.get_monitor_program_path() == original_path
-        general_settings._config.set.assert_not_called()
+        if selected_path:
+            assert general_settings._config.set_calls[-1] == ("general", "monitor_program_path", selected_path)
+            assert general_settings.get_monitor_program_path() == selected_path
+        else:
+            assert general_settings._config.set_calls == []
+            assert general_settings.get_monitor_program_path() == original_path
 
-    def test_signal_blocking_during_load(self, app, mock_config):
+    def test_signal_blocking_during_load(self, general_settings, fake_config):
         """Test that signals are blocked during config loading to prevent unwanted saves"""
-        mock_config.get.side_effect = lambda section, key, default="": {
-            ("general", "location_name"): "Loaded Location",
-            ("general", "monitor_program_path"): "/loaded/path.exe"
-        }.get((section, key), default)
-        
-        # Create widget (which calls _load_from_config)
-        widget = GeneralSettings(mock_config)
-        
-        # The fact that this doesn't cause errors proves signal blocking worked
-        # (otherwise loading config would trigger save attempts)
-        assert widget.get_location_name() == "Loaded Location"
-        assert widget.get_monitor_program_path() == "/loaded/path.exe"
-        
-        widget.deleteLater()
+        # Signal blocking worked if loading the config triggered no save attempts
+        assert fake_config.set_calls == []
+        assert general_settings.get_location_name() == "Test Location"
+        assert general_settings.get_monitor_program_path() == "/test/program.exe"
 
-    def test_button_connections(self, general_settings):
+    def test_button_connections(self, prebuilt_general_settings):
         """Test that buttons are properly connected to their methods"""
         # This is a basic test to ensure connections exist
         # More detailed testing would require signal/slot introspection
-        edit_btn = general_settings._edit_location_name_btn
-        choose_btn = general_settings._choose_file_btn
+        edit_btn = prebuilt_general_settings._edit_location_name_btn
+        choose_btn = prebuilt_general_settings._choose_file_btn
         
         # Verify buttons exist and have some connections
         assert edit_btn is not None
@@ -1,43 +1,44 @@
 """Tests for InfoBanner widget"""
 
 import pytest
-from unittest.mock import Mock, patch
-from PySide6.QtWidgets import QApplication
-import sys
+from unittest.mock import call, create_autospec, patch
 
 from monitor.gui.widgets.info_banner import InfoBanner
 from monitor.services.config_service import ConfigService
+from tests.fakes import FakeConfig
+
+# Config values used by most tests, built once at import
+_DEFAULT_CFG = {
+    ("general", "location_name"): "Test Location",
+    ("versions", "monitor_version"): "1.0.0",
+    ("versions", "ein_tzofia_version"): "2.0.0"
+}
 
 
 @pytest.fixture
-def app():
-    """Create QApplication for testing"""
-    if not QApplication.instance():
-        app = QApplication(sys.argv)
-    else:
-        app = QApplication.instance()
-    yield app
+def mock_config():
+    """Autospecced ConfigService for testing - calls are checked against the real signatures"""
+    return create_autospec(ConfigService, instance=True)
 
 
 @pytest.fixture
-def mock_config():
-    """Mock ConfigService for testing"""
-    config = Mock(spec=ConfigService)
-    config.get = Mock()
-    return config
+def banner_values():
+    """Mutable config values behind the info_banner fixture - update them, then refresh"""
+    return dict(_DEFAULT_CFG)
 
 
 @pytest.fixture
-def info_banner(app, mock_config):
-    """Create InfoBanner widget for testing"""
-    # Set up default mock returns
-    mock_config.get.side_effect = lambda section, key, default="": {
-        ("general", "location_name"): "Test Location",
-        ("versions", "monitor_version"): "1.0.0",
-        ("versions", "ein_tzofia_version"): "2.0.0"
-    }.get((section, key), default)
-    
-    banner = InfoBanner(mock_config)
+def info_banner(qtbot, banner_values):
+    """Create InfoBanner widget for testing - qtbot closes and deletes it afterwards"""
+    banner = InfoBanner(FakeConfig(banner_values))
+    qtbot.addWidget(banner)
+    return banner
+
+
+@pytest.fixture(scope="module")
+def prebuilt_banner(qapp):
+    """One InfoBanner built from the default config, shared by read-only tests"""
+    banner = InfoBanner(FakeConfig(_DEFAULT_CFG))
     yield banner
     banner.deleteLater()
 
@@ -45,40 +46,31 @@ def info_banner(app, mock_config):
 class TestInfoBanner:
     """Test cases for InfoBanner widget"""
 
-    @patch('monitor_prototype.services.config_service.ConfigService.get_instance')
-    def test_initialization(self, mock_get_instance, app, mock_config):
+    def test_initialization(self, qapp, mock_config, set_config_values):
         """Test banner initializes correctly"""
-        mock_get_instance.return_value = mock_config
-        mock_config.get.side_effect = lambda section, key, default="": {
-            ("general", "location_name"): "Test Location",
-            ("versions", "monitor_version"): "1.0.0",
-            ("versions", "ein_tzofia_version"): "2.0.0"
-        }.get((section, key), default)
+        set_config_values(mock_config, _DEFAULT_CFG)
         
         banner = InfoBanner(mock_config)
         
         # Check that required attributes exist
-        assert hasattr(banner, '_location_label')
-        assert hasattr(banner, '_monitor_version_label')
-        assert hasattr(banner, '_ein_tzofia_version_label')
+        assert banner._location_label is not None
+        assert banner._monitor_version_label is not None
+        assert banner._ein_tzofia_version_label is not None
         
         # Verify banner data was loaded with correct parameters
-        mock_config.get.assert_any_call("general", "location_name", "Unknown Location")
-        # Note: refresh_versions uses named parameters
-        mock_config.get.assert_any_call(section="versions", key="monitor_version", default="Unknown")
-        mock_config.get.assert_any_call(section="versions", key="ein_tzofia_version", default="Unknown")
+        assert call("general", "location_name", "Unknown Location") in mock_config.get.call_args_list
+        # Versions are read as one section
+        mock_config.get_section.assert_called_once_with("versions")
         
         banner.deleteLater()
 
-    @patch('monitor_prototype.services.config_service.ConfigService.get_instance')
-    def test_banner_data_display(self, mock_get_instance, app, mock_config):
+    def test_banner_data_display(self, qapp, mock_config, set_config_values):
         """Test that banner displays correct data"""
-        mock_get_instance.return_value = mock_config
-        mock_config.get.side_effect = lambda section, key, default="": {
+        set_config_values(mock_config, {
             ("general", "location_name"): "My Location",
             ("versions", "monitor_version"): "3.0.0",
             ("versions", "ein_tzofia_version"): "4.0.0"
-        }.get((section, key), default)
+        })
         
         banner = InfoBanner(mock_config)
         
@@ -93,11 +85,9 @@ class TestInfoBanner:
         
         banner.deleteLater()
 
-    @patch('monitor_prototype.services.config_service.ConfigService.get_instance')
-    def test_default_values_when_config_empty(self, mock_get_instance, app, mock_config):
+    def test_default_values_when_config_empty(self, qapp, mock_config, set_config_values):
         """Test banner shows default values when config is empty"""
-        mock_get_instance.return_value = mock_config
-        mock_config.get.side_effect = lambda section, key, default="": default
+        set_config_values(mock_config, {})
         
         banner = InfoBanner(mock_config)
         
@@ -111,112 +101,61 @@ class TestInfoBanner:
         
         banner.deleteLater()
 
-    def test_refresh_location(self, info_banner, mock_config):
-        """Test refresh_location method updates location display"""
-        
-        # Change the mock to return new location
-        mock_config.get.side_effect = lambda section, key, default="": {
-            ("general", "location_name"): "Updated Location",
-            ("versions", "monitor_version"): "1.0.0",
-            ("versions", "ein_tzofia_version"): "2.0.0"
-        }.get((section, key), default)
+    @pytest.mark.parametrize("location, monitor_version, ein_tzofia_version", [
+        ("Test Location", "1.0.0", "2.0.0"),
+        ("Updated Location", "1.0.0", "2.0.0"),
+        ("Test Location", "5.0.0", "6.0.0"),
+        ("Second Location", "2.0.0", "2.0.0"),
+    ])
+    def test_refresh_reflects_config(self, info_banner, banner_values,
+                                     location, monitor_version, ein_tzofia_version):
+        """Test that refresh_location/refresh_versions show the current config values"""
+        banner_values.update({
+            ("general", "location_name"): location,
+            ("versions", "monitor_version"): monitor_version,
+            ("versions", "ein_tzofia_version"): ein_tzofia_version
+        })
         
-        # Call refresh
         info_banner.refresh_location()
-        
-        # Check that location was updated
-        location_text = info_banner._location_label.text()
-        assert "Updated Location" in location_text
-
-    def test_refresh_versions(self, info_banner, mock_config):
-        """Test refresh_versions method updates version display"""
-        
-        # Change the mock to return new versions
-        mock_config.get.side_effect = lambda section, key, default="": {
-            ("general", "location_name"): "Test Location",
-            ("versions", "monitor_version"): "5.0.0",
-            ("versions", "ein_tzofia_version"): "6.0.0"
-        }.get((section, key), default)
-        
-        # Call refresh
         info_banner.refresh_versions()
         
-        # Check that versions were updated
-        monitor_text = info_banner._monitor_version_label.text()
-        ein_tzofia_text = info_banner._ein_tzofia_version_label.text()
-        assert "5.0.0" in monitor_text
-        assert "6.0.0" in ein_tzofia_text
-
-    def test_banner_styling(self, info_banner, mock_config):
+        # Each value lands in its own label
+        assert location in info_banner._location_label.text()
+        assert monitor_version in info_banner._monitor_version_label.text()
+        assert ein_tzofia_version in info_banner._ein_tzofia_version_label.text()
+
+    @pytest.mark.slow
+    def test_request_refresh_coalesces(self, info_banner, banner_values, qtbot):
+        """Test that several refresh requests within the throttle window run a single refresh"""
+        banner_values[("general", "location_name")] = "Queued Location"
+        
+        with patch.object(info_banner, 'refresh_location', wraps=info_banner.refresh_location) as mock_refresh:
+            info_banner.request_refresh()
+            info_banner.request_refresh()
+            
+            # Nothing runs synchronously
+            mock_refresh.assert_not_called()
+            
+            qtbot.waitUntil(lambda: not info_banner._refresh_timer.isActive())
+            assert mock_refresh.call_count == 1
+        
+        assert "Queued Location" in info_banner._location_label.text()
+
+    def test_banner_styling(self, prebuilt_banner):
         """Test that banner has correct styling"""
         
         # Check object name for styling
-        assert info_banner.objectName() == "info-banner"
-        # Check that labels exist (can't verify their objectName without knowing the implementation)
-        assert hasattr(info_banner, '_location_label')
-        assert hasattr(info_banner, '_monitor_version_label')
-        assert hasattr(info_banner, '_ein_tzofia_version_label')
-
-    def test_multiple_refresh_calls(self, info_banner, mock_config):
-        """Test that multiple refresh calls work correctly"""
-        
-        # First refresh
-        mock_config.get.side_effect = lambda section, key, default="": {
-            ("general", "location_name"): "First Location",
-            ("versions", "monitor_version"): "1.0.0",
-            ("versions", "ein_tzofia_version"): "1.0.0"
-        }.get((section, key), default)
-        
-        info_banner.refresh_location()
-        info_banner.refresh_versions()
-        
-        location_text = info_banner._location_label.text()
-        monitor_text = info_banner._monitor_version_label.text()
-        assert "First Location" in location_text
-        assert "1.0.0" in monitor_text
-        
-        # Second refresh with different values
-        mock_config.get.side_effect = lambda section, key, default="": {
-            ("general", "location_name"): "Second Location",
-            ("versions", "monitor_version"): "2.0.0",
-            ("versions", "ein_tzofia_version"): "2.0.0"
-        }.get((section, key), default)
-        
-        info_banner.refresh_location()
-        info_banner.refresh_versions()
-        
-        location_text = info_banner._location_label.text()
-        monitor_text = info_banner._monitor_version_label.text()
-        assert "Second Location" in location_text
-        assert "2.0.0" in monitor_text
-
-    def test_banner_format_consistency(self, info_banner, mock_config):
-        """Test that banner format remains consistent"""
-        mock_config.get.side_effect = lambda section, key, default="": {
-            ("general", "location_name"): "Test Location",
-            ("versions", "monitor_version"): "1.0.0",
-            ("versions", "ein_tzofia_version"): "2.0.0"
-        }.get((section, key), default)
-        
-        info_banner.refresh_location()
-        info_banner.refresh_versions()
-        
-        location_text = info_banner._location_label.text()
-        monitor_text = info_banner._monitor_version_label.text()
-        ein_tzofia_text = info_banner._ein_tzofia_version_label.text()
-        
-        # Check expected format in separate labels
-        assert "Test Location" in location_text
-        assert "1.0.0" in monitor_text
-        assert "2.0.0" in ein_tzofia_text
-
-    def test_widget_structure(self, info_banner):
+        assert prebuilt_banner.objectName() == "info-banner"
+
+    @pytest.mark.parametrize("attr", [
+        "_location_label",
+        "_monitor_version_label",
+        "_ein_tzofia_version_label",
+    ])
+    def test_has_label(self, prebuilt_banner, attr):
+        """Test that location and versions each get their own label"""
+        assert getattr(prebuilt_banner, attr, None) is not None
+
+    def test_widget_structure(self, prebuilt_banner):
         """Test that widget has correct structure"""
-        # Should have separate labels for location and versions
-        assert hasattr(info_banner, '_location_label')
-        assert hasattr(info_banner, '_monitor_version_label')
-        assert hasattr(info_banner, '_ein_tzofia_version_label')
-        assert info_banner._location_label is not None
-        assert info_banner._monitor_version_label is not None
-        assert info_banner._ein_tzofia_version_label is not None
-        assert info_banner.layout() is not None
+        assert prebuilt_banner.layout() is not None
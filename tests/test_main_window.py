@@ -1,308 +1,204 @@
 """Tests for MainWindow"""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from PySide6.QtWidgets import QApplication
-import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QLabel
 
 from monitor.gui.main_window import MainWindow
-from monitor.services.config_service import ConfigService
+from tests.fakes import FakeConfig
+
+# Every test here builds a full MainWindow (nav bar, banner and initial page)
+pytestmark = pytest.mark.slow
+
+
+# Values for tests that open the real settings page
+_SETTINGS_CFG = {
+    ("general", "location_name"): "Test Location",
+    ("general", "monitor_program_path"): "/test/path",
+    ("system", "enable_restart"): False,
+    ("system", "restart_time"): "12:00",
+    ("system", "enable_ein_tzofia"): True
+}
+
+
+@pytest.fixture
+def config_values():
+    """Mutable values behind fake_config - empty unless a test fills them in"""
+    return {}
+
+
+@pytest.fixture
+def fake_config(config_values):
+    """FakeConfig standing in for ConfigService"""
+    return FakeConfig(config_values)
+
+
+@pytest.fixture
+def stub_create_page(monkeypatch):
+    """Return a helper that makes PageFactory.create_page return (or raise) one result"""
+    def _stub(result):
+        """Returns the list of page names create_page is called with"""
+        calls = []
+
+        def create_page(page_name):
+            calls.append(page_name)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr('monitor.gui.main_window.PageFactory.create_page', create_page)
+        return calls
+    return _stub
+
+
+@pytest.fixture
+def patch_config_service(monkeypatch, fake_config):
+    """Make ConfigService.get_instance() return fake_config, for pages that look it up themselves"""
+    monkeypatch.setattr('monitor.services.config_service.ConfigService.get_instance', lambda: fake_config)
 
 
 @pytest.fixture
-def app():
-    """Create QApplication for testing"""
-    if not QApplication.instance():
-        app = QApplication(sys.argv)
-    else:
-        app = QApplication.instance()
-    yield app
+def make_widget(qapp):
+    """Return a factory that builds widgets and deletes them all in one pass at teardown"""
+    widgets = []
+
+    def _make(widget_cls, *args):
+        widget = widget_cls(*args)
+        widgets.append(widget)
+        return widget
+
+    yield _make
+    for widget in widgets:
+        widget.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
 
 
 @pytest.fixture
-def mock_config():
-    """Mock ConfigService for testing"""
-    config = Mock(spec=ConfigService)
-    config.get = Mock()
-    return config
+def fresh_instance():
+    """Clear the MainWindow singleton after the test, so no deleted window is left behind"""
+    yield
+    MainWindow._instance = None
+
+
+@pytest.fixture(scope="class")
+def shared_window(qapp):
+    """One MainWindow per test class, for tests that leave it as they found it"""
+    window = MainWindow(FakeConfig({}))
+    yield window
+    window.deleteLater()
 
 
 class TestMainWindow:
     """Test cases for MainWindow"""
 
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    def test_singleton_pattern(self, mock_get_instance, app, mock_config):
+    def test_singleton_pattern(self, fresh_instance, make_widget, fake_config):
         """Test that MainWindow follows singleton pattern"""
-        mock_get_instance.return_value = mock_config
         
-        # Reset singleton instance
-        MainWindow._instance = None
-        
-        window1 = MainWindow()
+        window1 = make_widget(MainWindow, fake_config)
         window2 = MainWindow.get_instance()
         
         assert window1 is window2
-        
-        # Cleanup
-        MainWindow._instance = None
-        window1.deleteLater()
 
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    def test_initialization_components(self, mock_get_instance, app, mock_config):
+    def test_initialization_components(self, shared_window):
         """Test that MainWindow initializes all components correctly"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
-        window = MainWindow()
-        
-        # Check that main components exist
-        assert hasattr(window, '_info_banner')
-        assert hasattr(window, '_nav_bar')
-        assert hasattr(window, '_content_layout')
-        assert hasattr(window, '_current_page')
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
+        # Check that main components exist (one instance-dict check, no attribute lookups)
+        expected = {'_info_banner', '_nav_bar', '_content_layout', '_current_page'}
+        assert expected <= vars(shared_window).keys()
+        # The injected config is used instead of the ConfigService singleton
+        assert isinstance(shared_window._config_service, FakeConfig)
 
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    def test_window_title_and_icon_setup(self, mock_get_instance, app, mock_config):
+    def test_window_title_and_icon_setup(self, shared_window):
         """Test window title and icon are set correctly"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
-        window = MainWindow()
-        
         # Check window title (adjust expectation to match actual title)
-        assert window.windowTitle() == "Monitor"
+        assert shared_window.windowTitle() == "Monitor"
         
         # Check that icon was attempted to be set (icon might not load in test environment)
-        assert window.windowIcon() is not None
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
-
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    @patch('monitor_prototype.gui.main_window.PageFactory.create_page')
-    def test_page_navigation(self, mock_create_page, mock_get_instance, app, mock_config):
-        """Test page navigation functionality"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
-        # Create a proper settings page mock with required methods
-        from PySide6.QtWidgets import QWidget
-        from unittest.mock import Mock
-        
-        mock_page = QWidget()
-        mock_general_settings = Mock()
-        mock_page.get_general_settings = Mock(return_value=mock_general_settings)
-        
-        mock_create_page.return_value = mock_page
-        
-        window = MainWindow()
-        
-        # Test page change
-        window._update_content("settings")
-        
-        # Verify page was created and added
-        mock_create_page.assert_called_with("settings")
-        assert window._current_page == "settings"
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
-        mock_page.deleteLater()
-
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    @patch('monitor_prototype.gui.main_window.PageFactory.create_page')
-    def test_same_page_navigation_ignored(self, mock_create_page, mock_get_instance, app, mock_config):
-        """Test that navigating to same page doesn't recreate it"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
-        # Create initial page
-        from PySide6.QtWidgets import QLabel
-        initial_page = QLabel("Initial Page")
-        mock_create_page.return_value = initial_page
-        
-        window = MainWindow()
-        window._current_page = "settings"
-        
-        # Try to navigate to same page
-        window._update_content("settings")
-        
-        # Verify page was not created again (should only have been called during __init__)
-        assert mock_create_page.call_count == 1  # Only called during setup
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
-        initial_page.deleteLater()
-
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    def test_refresh_banner_location_method(self, mock_get_instance, app, mock_config):
+        assert shared_window.windowIcon() is not None
+
+    @pytest.mark.parametrize("page_kind, start_page, page_name, expected_page, expected_calls, connects", [
+        ("settings", None, "settings", "settings", ["alerts", "settings"], True),
+        ("settings", "settings", "settings", "settings", ["alerts"], False),
+        ("plain", None, "contacts", "contacts", ["alerts", "contacts"], False),
+        ("error", None, "unknown_page", None, ["alerts", "unknown_page"], False),
+    ], ids=["settings_page", "same_page_ignored", "non_settings_page", "unknown_page"])
+    def test_update_content(self, make_widget, fake_config, stub_create_page, page_kind, start_page,
+                            page_name, expected_page, expected_calls, connects):
+        """Test page navigation, same-page skipping, settings signal wiring and page errors"""
+        connected = []
+        if page_kind == "error":
+            # Page creation fails - an error widget is shown instead
+            calls = stub_create_page(ValueError("Unknown page"))
+        else:
+            # The window adopts the page into its content area, so it is deleted along with it
+            page = QLabel("Page")
+            if page_kind == "settings":
+                general_settings = SimpleNamespace(location_changed=SimpleNamespace(connect=connected.append))
+                page.get_general_settings = lambda: general_settings
+            calls = stub_create_page(page)
+        
+        window = make_widget(MainWindow, fake_config)
+        if start_page:
+            window._current_page = start_page
+        
+        window._update_content(page_name)
+        
+        # create_page already ran once for the initial "alerts" page during __init__
+        assert calls == expected_calls
+        assert window._current_page == expected_page
+        # Only a newly created settings page gets its location signal wired up
+        assert connected == ([window.refresh_banner_location] if connects else [])
+
+    def test_refresh_banner_location_method(self, shared_window, monkeypatch):
         """Test refresh_banner_location method"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
-        window = MainWindow()
-        
-        # Mock the info banner
-        window._info_banner = Mock()
+        # Stub the info banner (monkeypatch restores the real one afterwards)
+        requests = []
+        monkeypatch.setattr(shared_window, '_info_banner',
+                            SimpleNamespace(request_refresh=lambda: requests.append(True)))
         
         # Call refresh method
-        window.refresh_banner_location()
-        
-        # Verify banner refresh was called
-        window._info_banner.refresh_location.assert_called_once()
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
-
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    @patch('monitor_prototype.gui.main_window.PageFactory.create_page')
-    def test_signal_connection_for_settings_page(self, mock_create_page, mock_get_instance, app, mock_config):
-        """Test that signals are connected when settings page is created"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
-        # Mock settings page with general settings
-        mock_general_settings = Mock()
-        from PySide6.QtWidgets import QLabel
-        mock_settings_page = QLabel("Settings Page")
-        mock_settings_page.get_general_settings = Mock(return_value=mock_general_settings)
-        mock_create_page.return_value = mock_settings_page
-        
-        window = MainWindow()
-        
-        # Navigate to settings page
-        window._update_content("settings")
-        
-        # Verify signal connection was attempted
-        mock_settings_page.get_general_settings.assert_called_once()
-        mock_general_settings.location_changed.connect.assert_called_once_with(window.refresh_banner_location)
+        shared_window.refresh_banner_location()
         
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
-        mock_settings_page.deleteLater()
-
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    @patch('monitor_prototype.gui.main_window.PageFactory.create_page')
-    def test_signal_connection_only_for_settings(self, mock_create_page, mock_get_instance, app, mock_config):
-        """Test that signals are only connected for settings pages"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
-        from PySide6.QtWidgets import QLabel
-        mock_page = QLabel("Alert Page")
-        mock_create_page.return_value = mock_page
-        
-        window = MainWindow()
-        
-        # Navigate to non-settings page
-        window._update_content("alerts")
-        
-        # Verify no signal connection attempts were made (no get_general_settings method)
-        assert not hasattr(mock_page, 'get_general_settings')
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
-        mock_page.deleteLater()
-
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    @patch('monitor_prototype.gui.main_window.PageFactory.create_page')
-    def test_error_handling_for_unknown_page(self, mock_create_page, mock_get_instance, app, mock_config):
-        """Test error handling when page creation fails"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
-        # Mock page creation to raise error
-        mock_create_page.side_effect = ValueError("Unknown page")
-        
-        window = MainWindow()
-        
-        # Try to navigate to unknown page
-        window._update_content("unknown_page")
-        
-        # Should create error widget instead
-        assert window._current_page is None  # Page wasn't set due to error
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
+        # Verify a (coalesced) banner refresh was requested
+        assert len(requests) == 1
 
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    def test_content_clearing(self, mock_get_instance, app, mock_config):
+    def test_content_clearing(self, make_widget, fake_config, config_values, patch_config_service):
         """Test that content is cleared before adding new content"""
-        mock_get_instance.return_value = mock_config
         # Make sure config returns proper values for all settings components
-        mock_config.get.side_effect = lambda section, key, default=None: {
-            ("general", "location_name"): "Test Location",
-            ("general", "monitor_program_path"): "/test/path",
-            ("system", "enable_restart"): False,
-            ("system", "restart_time"): "12:00",
-            ("system", "enable_ein_tzofia"): True
-        }.get((section, key), default)
+        config_values.update(_SETTINGS_CFG)
         
-        MainWindow._instance = None
+        window = make_widget(MainWindow, fake_config)
         
-        window = MainWindow()
-        
-        # Add a real widget to content layout
-        from PySide6.QtWidgets import QLabel
-        test_widget = QLabel("Test Widget")
+        # Add a real widget to content layout (parented, so it goes when the window does)
+        test_widget = QLabel("Test Widget", window)
         window._content_layout.addWidget(test_widget)
         
         # Clear content should be called during update
         with patch.object(window, '_clear_content') as mock_clear:
             window._update_content("settings")
             mock_clear.assert_called_once()
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
-        test_widget.deleteLater()
 
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    def test_navigation_bar_signal_connection(self, mock_get_instance, app, mock_config):
+    def test_navigation_bar_signal_connection(self, shared_window, monkeypatch):
         """Test that navigation bar signals are connected"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
+        # Stub the navigation bar (monkeypatch restores the real one afterwards)
+        connected = []
+        monkeypatch.setattr(shared_window, '_nav_bar',
+                            SimpleNamespace(page_changed=SimpleNamespace(connect=connected.append)))
         
-        window = MainWindow()
+        # Simulate the connection setup (would normally happen in _connect_signals)
+        shared_window._nav_bar.page_changed.connect(shared_window._on_page_changed)
         
-        # Mock the navigation bar
-        mock_nav_bar = Mock()
-        window._nav_bar = mock_nav_bar
-        
-        # Simulate the connection setup (would normally happen in _setup_signals)
-        with patch.object(window, '_on_page_changed') as mock_handler:
-            window._nav_bar.page_changed.connect(mock_handler)
-            
-            # Verify connection was made
-            mock_nav_bar.page_changed.connect.assert_called_with(mock_handler)
-        
-        # Cleanup
-        MainWindow._instance = None
-        window.deleteLater()
+        # Verify connection was made
+        assert connected == [shared_window._on_page_changed]
 
-    @patch('monitor_prototype.gui.main_window.ConfigService.get_instance')
-    def test_multiple_get_instance_calls(self, mock_get_instance, app, mock_config):
+    def test_multiple_get_instance_calls(self, fresh_instance, make_widget, fake_config):
         """Test multiple calls to get_instance return same object"""
-        mock_get_instance.return_value = mock_config
-        MainWindow._instance = None
-        
+        window = make_widget(MainWindow, fake_config)
         instance1 = MainWindow.get_instance()
         instance2 = MainWindow.get_instance()
         instance3 = MainWindow.get_instance()
         
+        assert instance1 is window
         assert instance1 is instance2 is instance3
-        
-        # Cleanup
-        MainWindow._instance = None
-        if instance1:
-            instance1.deleteLater()
@@ -0,0 +1,47 @@
+"""Tests for NavigationBar widget"""
+
+import pytest
+
+from monitor.gui.widgets.navigation_bar import NavigationBar
+
+
+class TestNavigationBar:
+    """Test cases for NavigationBar widget"""
+
+    @pytest.fixture(autouse=True)
+    def _nav_bar(self, qapp):
+        """Build a fresh NavigationBar for each test"""
+        self.nav_bar = NavigationBar()
+        yield
+        self.nav_bar.deleteLater()
+
+    def test_buttons_created(self):
+        """Test that one button exists per page, in display order"""
+        manager = self.nav_bar._button_manager
+        assert manager.button_count == 3
+        for name in ["alerts", "contacts", "settings"]:
+            assert manager.get_button(name) is not None
+
+    def test_default_selection(self):
+        """Test that the alerts page is selected initially"""
+        assert self.nav_bar._button_manager.selected_name == "alerts"
+
+    def test_click_emits_page_changed(self):
+        """Test that clicking a button emits page_changed with its page name"""
+        emitted = []
+        self.nav_bar.page_changed.connect(emitted.append)
+
+        self.nav_bar._button_manager.get_button("settings").click()
+
+        assert emitted == ["settings"]
+        assert self.nav_bar._button_manager.selected_name == "settings"
+
+    def test_select_does_not_emit(self):
+        """Test that programmatic selection updates the buttons without emitting"""
+        emitted = []
+        self.nav_bar.page_changed.connect(emitted.append)
+
+        self.nav_bar.select("contacts")
+
+        assert emitted == []
+        assert self.nav_bar._button_manager.selected_name == "contacts"
@@ -0,0 +1,97 @@
+"""Tests for RWLock"""
+
+import threading
+
+from monitor.utils.rw_lock import RWLock
+
+
+class TestRWLock:
+    """Test cases for RWLock"""
+
+    def test_concurrent_readers(self):
+        """Test that several threads can hold the read lock at once"""
+        lock = RWLock()
+        barrier = threading.Barrier(3, timeout=1)
+        results = []
+
+        def reader():
+            with lock.read_lock():
+                # Only passes if all readers are inside the lock together
+                barrier.wait()
+                results.append(True)
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True, True, True]
+
+    def test_writer_excludes_readers(self):
+        """Test that a reader cannot enter while another thread writes"""
+        lock = RWLock()
+        results = []
+
+        with lock.write_lock():
+            thread = threading.Thread(target=lambda: results.append(lock.acquire_read(timeout=0.05)))
+            thread.start()
+            thread.join()
+
+        assert results == [False]
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """Test writer preference - new readers queue behind a waiting writer"""
+        lock = RWLock()
+        results = []
+
+        lock.acquire_read()
+        writer = threading.Thread(target=lambda: results.append(("writer", lock.acquire_write(timeout=1))))
+        writer.start()
+
+        # Give the writer time to start waiting
+        writer.join(timeout=0.05)
+        reader = threading.Thread(target=lambda: results.append(("reader", lock.acquire_read(timeout=0.05))))
+        reader.start()
+        reader.join()
+
+        lock.release_read()
+        writer.join()
+
+        assert ("reader", False) in results
+        assert ("writer", True) in results
+
+    def test_writer_is_reentrant_and_may_read(self):
+        """Test that the writing thread can re-enter and take the read side"""
+        lock = RWLock()
+
+        with lock.write_lock():
+            with lock.write_lock():
+                with lock.read_lock():
+                    pass
+
+        # Fully released - another thread can write
+        results = []
+        thread = threading.Thread(target=lambda: results.append(lock.acquire_write(timeout=0.05)))
+        thread.start()
+        thread.join()
+        assert results == [True]
+
+    def test_write_lock_timeout_raises(self):
+        """Test that the context manager raises TimeoutError when the lock is busy"""
+        lock = RWLock()
+        errors = []
+
+        def writer():
+            try:
+                with lock.write_lock(timeout=0.05):
+                    pass
+            except TimeoutError as e:
+                errors.append(e)
+
+        with lock.read_lock():
+            thread = threading.Thread(target=writer)
+            thread.start()
+            thread.join()
+
+        assert len(errors) == 1
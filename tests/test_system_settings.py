@@ -1,220 +1,219 @@
 """Tests for SystemSettings widget"""
 
 import pytest
-from unittest.mock import Mock, patch
-from PySide6.QtWidgets import QApplication
-import sys
+from unittest.mock import MagicMock, Mock, create_autospec, patch
+from PySide6.QtWidgets import QLineEdit, QDialogButtonBox
+from PySide6.QtGui import QValidator
 
 from monitor.gui.pages.settings_sub_pages.system_settings import SystemSettings
 from monitor.services.config_service import ConfigService
+from tests.fakes import FakeConfig
 
+# Keep these tests on one xdist worker (run with -n auto --dist loadgroup)
+pytestmark = pytest.mark.xdist_group("qt_gui")
 
-@pytest.fixture
-def app():
-    """Create QApplication for testing"""
-    if not QApplication.instance():
-        app = QApplication(sys.argv)
-    else:
-        app = QApplication.instance()
-    yield app
+# Config values used by the system_settings fixture, built once at import
+_DEFAULT_CFG = {
+    ("system", "enable_restart"): True,
+    ("system", "minutes_to_restart"): "5",
+    ("system", "startup_snooze_time"): "5"
+}
 
 
 @pytest.fixture
 def mock_config():
-    """Mock ConfigService for testing"""
-    config = Mock(spec=ConfigService)
-    config.get = Mock()
-    config.set = Mock()
-    return config
+    """Autospecced ConfigService for testing - calls are checked against the real signatures"""
+    return create_autospec(ConfigService, instance=True)
 
 
 @pytest.fixture
-def system_settings(app, mock_config):
-    """Create SystemSettings widget for testing"""
-    # Set up default mock returns
-    mock_config.get.side_effect = lambda section, key, default=False: {
-        ("system", "enable_restart"): True,
-        ("system", "minutes_to_restart"): "5"
-    }.get((section, key), default)
-    
+def system_settings(qtbot, mock_config, set_config_values):
+    """Create SystemSettings widget for testing - qtbot closes and deletes it afterwards"""
+    set_config_values(mock_config, _DEFAULT_CFG)
     widget = SystemSettings(mock_config)
+    qtbot.addWidget(widget)
+    return widget
+
+
+@pytest.fixture(scope="module")
+def system_settings_ro(qapp):
+    """One SystemSettings built from the default config, shared by read-only tests"""
+    widget = SystemSettings(FakeConfig(_DEFAULT_CFG))
     yield widget
     widget.deleteLater()
 
 
+@pytest.fixture(autouse=True)
+def message_box(monkeypatch):
+    """Replace QMessageBox where SystemSettings looks it up so no real dialog can block a test"""
+    box = MagicMock()
+    monkeypatch.setattr('monitor.gui.pages.settings_sub_pages.system_settings.QMessageBox', box)
+    return box
+
+
 class TestSystemSettings:
     """Test cases for SystemSettings widget"""
 
     def test_initialization(self, system_settings, mock_config):
         """Test widget initializes correctly"""
         assert system_settings._config is mock_config
-        assert hasattr(system_settings, '_enable_restart_checkbox')
-        assert hasattr(system_settings, '_restart_time_display')
-        assert hasattr(system_settings, '_open_ein_tzofia_btn')
-        assert hasattr(system_settings, '_close_ein_tzofia_btn')
-        assert hasattr(system_settings, '_edit_restart_time_btn')
+        assert system_settings._enable_restart_checkbox is not None
+        assert system_settings._restart_time_display is not None
+        assert system_settings._open_ein_tzofia_btn is not None
+        assert system_settings._close_ein_tzofia_btn is not None
+        assert system_settings._edit_restart_time_btn is not None
 
-    def test_load_from_config(self, app, mock_config):
+    def test_load_from_config(self, qtbot, mock_config, set_config_values):
         """Test that config is loaded during initialization"""
-        mock_config.get.side_effect = lambda section, key, default=False: {
+        set_config_values(mock_config, {
             ("system", "enable_restart"): True,
             ("system", "minutes_to_restart"): "10"
-        }.get((section, key), default)
+        })
         
         widget = SystemSettings(mock_config)
+        qtbot.addWidget(widget)
         
-        # Verify config was queried
-        mock_config.get.assert_any_call("system", "enable_restart", False)
-        mock_config.get.assert_any_call("system", "minutes_to_restart", "")
+        # Verify config was queried as one section
+        mock_config.get_section.assert_called_once_with("system")
         
         # Verify UI was updated
         assert widget.get_enable_restart() is True
         assert widget.get_restart_time() == "10"
-        
-        widget.deleteLater()
 
-    def test_getters_and_setters(self, system_settings):
-        """Test getter and setter methods"""
-        # Test restart enable
-        system_settings.set_enable_restart(False)
-        assert system_settings.get_enable_restart() is False
-        
-        system_settings.set_enable_restart(True)
-        assert system_settings.get_enable_restart() is True
-        
-        # Test restart time
-        system_settings.set_restart_time("15")
-        assert system_settings.get_restart_time() == "15"
-
-    def test_ui_elements_created(self, system_settings):
-        """Test that all UI elements are created properly"""
-        # Test checkbox
-        assert system_settings._enable_restart_checkbox is not None
-        assert system_settings._enable_restart_checkbox.text() == "Enable Restart"
-        assert system_settings._enable_restart_checkbox.objectName() == "settings-checkbox"
-        
-        # Test restart time display
-        assert system_settings._restart_time_display is not None
-        assert system_settings._restart_time_display.isReadOnly()
-        assert system_settings._restart_time_display.objectName() == "settings-display"
-        
-        # Test buttons
-        assert system_settings._open_ein_tzofia_btn is not None
-        assert system_settings._open_ein_tzofia_btn.text() == "Open Ein Tzofia"
-        assert system_settings._open_ein_tzofia_btn.objectName() == "open-button"
-        
-        assert system_settings._close_ein_tzofia_btn is not None
-        assert system_settings._close_ein_tzofia_btn.text() == "Close Ein Tzofia"
-        assert system_settings._close_ein_tzofia_btn.objectName() == "close-button"
-        
-        assert system_settings._edit_restart_time_btn is not None
-        assert system_settings._edit_restart_time_btn.text() == "Edit"
-        assert system_settings._edit_restart_time_btn.objectName() == "settings-button"
+    @pytest.mark.parametrize("enabled", [False, True])
+    def test_enable_restart_round_trip(self, system_settings, enabled):
+        """Test that set_enable_restart is reflected by get_enable_restart"""
+        system_settings.set_enable_restart(enabled)
+        assert system_settings.get_enable_restart() is enabled
+
+    @pytest.mark.parametrize("value", ["15", "25", "30", "35"])
+    def test_restart_time_round_trip(self, system_settings, value):
+        """Test that set_restart_time is reflected by get_restart_time"""
+        system_settings.set_restart_time(value)
+        assert system_settings.get_restart_time() == value
+
+    @pytest.mark.parametrize("attr, expected_text, expected_obj", [
+        ("_enable_restart_checkbox", "Enable Restart", "settings-checkbox"),
+        ("_open_ein_tzofia_btn", "Open Ein Tzofia", "open-button"),
+        ("_close_ein_tzofia_btn", "Close Ein Tzofia", "close-button"),
+        ("_edit_restart_time_btn", "Edit", "settings-button"),
+    ])
+    def test_ui_elements_created(self, system_settings_ro, attr, expected_text, expected_obj):
+        """Test that the checkbox and buttons are created with their text and style name"""
+        element = getattr(system_settings_ro, attr)
+        assert element is not None
+        assert element.text() == expected_text
+        assert element.objectName() == expected_obj
+
+    def test_restart_time_display_created(self, system_settings_ro):
+        """Test that the restart time display is read-only and styled"""
+        display = system_settings_ro._restart_time_display
+        assert display is not None
+        assert display.isReadOnly()
+        assert display.objectName() == "settings-display"
 
     def test_checkbox_triggers_save(self, system_settings):
         """Test that checkbox changes trigger config save"""
         # Toggle checkbox
         system_settings._enable_restart_checkbox.setChecked(False)
         
-        # Should trigger save to config
-        system_settings._config.set.assert_called()
-
-    @patch('PySide6.QtWidgets.QInputDialog')
-    def test_edit_restart_time_dialog(self, mock_input_dialog, system_settings):
-        """Test restart time edit dialog"""
-        # Mock input dialog to return valid time
-        mock_input_dialog.getText.return_value = ("20", True)
-        
-        # Call edit method
-        system_settings._edit_restart_time()
+        # Write is debounced - nothing persisted until the flush runs
+        system_settings._config.set.assert_not_called()
+        system_settings._flush_pending()
         
-        # Verify dialog was called
-        mock_input_dialog.getText.assert_called_once()
-        
-        # Verify UI and config were updated
-        assert system_settings.get_restart_time() == "20"
-        system_settings._config.set.assert_called()
-
-    @patch('PySide6.QtWidgets.QInputDialog')
-    def test_edit_restart_time_dialog_cancelled(self, mock_input_dialog, system_settings):
-        """Test restart time edit dialog when cancelled"""
-        # Mock input dialog to return cancelled
-        mock_input_dialog.getText.return_value = ("", False)
+        # Should trigger save to config
+        system_settings._config.set.assert_called_once_with("system", "enable_restart", False)
+
+    def test_unchanged_values_not_saved(self, system_settings):
+        """Test that values matching the stored config are not written again"""
+        system_settings._save_to_config()
+        system_settings._flush_pending()
+        
+        system_settings._config.set.assert_not_called()
+
+    @pytest.mark.parametrize("accepted, text, expected_time", [
+        (1, "20", "20"),
+        (0, "20", None),
+        (1, "", None),
+    ], ids=["accepted", "cancelled", "accepted_empty"])
+    def test_edit_restart_time_dialog(self, system_settings, accepted, text, expected_time):
+        """Test restart time edit dialog - only an accepted, non-empty value is shown and saved"""
+        mock_dialog = Mock()
+        mock_dialog.exec.return_value = accepted
+        mock_dialog.textValue.return_value = text
         original_time = system_settings.get_restart_time()
         
-        # Call edit method
-        system_settings._edit_restart_time()
+        with patch.object(system_settings, '_create_restart_time_dialog', return_value=mock_dialog) as mock_create:
+            system_settings._edit_restart_time()
         
-        # Verify nothing changed
-        assert system_settings.get_restart_time() == original_time
-
-    @patch('PySide6.QtWidgets.QInputDialog')
-    @patch('PySide6.QtWidgets.QMessageBox')
-    def test_edit_restart_time_invalid_input(self, mock_message_box, mock_input_dialog, system_settings):
-        """Test restart time edit with invalid input"""
-        # Mock input dialog to return invalid input
-        mock_input_dialog.getText.return_value = ("invalid", True)
-        original_time = system_settings.get_restart_time()
+        # Verify dialog was shown pre-filled with the current value
+        mock_create.assert_called_once_with("5")
+        mock_dialog.exec.assert_called_once()
         
-        # Call edit method
-        system_settings._edit_restart_time()
+        # None means the edit is dropped and nothing changes
+        assert system_settings.get_restart_time() == (expected_time or original_time)
+        assert system_settings._config.set.called == (expected_time is not None)
+
+    def test_edit_restart_time_rejects_invalid_input(self, system_settings):
+        """Test that the restart time dialog does not accept non-numeric input"""
+        # Parented to the widget, so qtbot deletes it along with system_settings
+        dialog = system_settings._create_restart_time_dialog("5")
+        line_edit = dialog.findChild(QLineEdit)
+        ok_button = dialog.findChild(QDialogButtonBox).button(QDialogButtonBox.StandardButton.Ok)
+        validator = line_edit.validator()
         
-        # Verify error message was shown
-        mock_message_box.warning.assert_called_once()
+        assert validator.validate("invalid", 0)[0] == QValidator.State.Invalid
+        assert validator.validate("12.5", 0)[0] == QValidator.State.Acceptable
+        assert ok_button.isEnabled()
         
-        # Verify time wasn't changed
-        assert system_settings.get_restart_time() == original_time
+        # An incomplete value keeps OK disabled
+        line_edit.setText("")
+        assert not ok_button.isEnabled()
 
-    @patch('monitor_prototype.gui.pages.settings_sub_pages.system_settings.QMessageBox')
-    def test_close_ein_tzofia_confirmation(self, mock_message_box, system_settings):
+    def test_close_ein_tzofia_confirmation(self, message_box, system_settings):
         """Test close Ein Tzofia confirmation dialog"""
         # Mock confirmation dialog to return Yes
-        mock_message_box.question.return_value = mock_message_box.StandardButton.Yes
+        message_box.question.return_value = message_box.StandardButton.Yes
         
         # Call close method
         system_settings._confirm_close_ein_tzofia()
         
         # Verify confirmation dialog was shown
-        mock_message_box.question.assert_called_once()
+        message_box.question.assert_called_once()
 
-    @patch('monitor_prototype.gui.pages.settings_sub_pages.system_settings.QMessageBox')
-    def test_close_ein_tzofia_confirmation_cancelled(self, mock_message_box, system_settings):
+    def test_close_ein_tzofia_confirmation_cancelled(self, message_box, system_settings):
         """Test close Ein Tzofia when confirmation is cancelled"""
         # Mock confirmation dialog to return Cancel
-        mock_message_box.question.return_value = mock_message_box.StandardButton.Cancel
+        message_box.question.return_value = message_box.StandardButton.Cancel
         
         # Call close method
         system_settings._confirm_close_ein_tzofia()
         
         # Verify confirmation dialog was shown but nothing else happened
-        mock_message_box.question.assert_called_once()
-
-    def test_legacy_methods(self, system_settings):
-        """Test legacy compatibility methods"""
-        # Test legacy getters
-        system_settings.set_restart_time("25")
-        assert system_settings.get_minutes_to_restart() == "25"
-        assert system_settings.get_startup_snooze_time() == "25"
-        
-        # Test legacy setters
-        system_settings.set_minutes_to_restart("30")
-        assert system_settings.get_restart_time() == "30"
-        
-        system_settings.set_startup_snooze_time("35")
-        assert system_settings.get_restart_time() == "35"
-
-    def test_signal_blocking_during_load(self, app, mock_config):
+        message_box.question.assert_called_once()
+
+    @pytest.mark.parametrize("setter, getter, value", [
+        ("set_restart_time", "get_minutes_to_restart", "25"),
+        ("set_restart_time", "get_startup_snooze_time", "25"),
+        ("set_minutes_to_restart", "get_restart_time", "30"),
+        ("set_startup_snooze_time", "get_restart_time", "35"),
+    ])
+    def test_legacy_methods(self, system_settings, setter, getter, value):
+        """Test that legacy getters/setters share the restart time value"""
+        getattr(system_settings, setter)(value)
+        assert getattr(system_settings, getter)() == value
+
+    def test_signal_blocking_during_load(self, qtbot, mock_config, set_config_values):
         """Test that signals are blocked during config loading"""
-        mock_config.get.side_effect = lambda section, key, default=False: {
+        set_config_values(mock_config, {
             ("system", "enable_restart"): True,
             ("system", "minutes_to_restart"): "8"
-        }.get((section, key), default)
+        })
         
         # Create widget (which calls _load_from_config)
         widget = SystemSettings(mock_config)
+        qtbot.addWidget(widget)
         
         # The fact that this doesn't cause save calls proves signal blocking worked
         assert widget.get_enable_restart() is True
         assert widget.get_restart_time() == "8"
-        
-        widget.deleteLater()